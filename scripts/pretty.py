@@ -0,0 +1,58 @@
+# scripts/pretty.py
+"""
+Pretty-print the compact JSON outputs of the processing pipeline
+Pipeline files are written without indentation; use this for human review
+"""
+
+import sys
+import argparse
+import json
+from pathlib import Path
+
+
+def pretty_print(file_path: Path, in_place: bool = False) -> None:
+    """
+    Re-serialize a JSON file with indentation
+    
+    Args:
+        file_path (Path): JSON file to format
+        in_place (bool): Overwrite the file instead of printing to stdout
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    if in_place:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    else:
+        json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+
+
+def main():
+    """
+    Main function for command line execution
+    """
+    parser = argparse.ArgumentParser(description='Pretty-print pipeline JSON output files')
+    parser.add_argument('files', nargs='+', help='JSON file(s) to format (e.g. data/processed/chunks.json)')
+    parser.add_argument('--in-place', action='store_true', help='Overwrite files instead of printing to stdout')
+    
+    args = parser.parse_args()
+    
+    for file_name in args.files:
+        file_path = Path(file_name)
+        if not file_path.exists():
+            print(f"❌ فایل یافت نشد: {file_path}", file=sys.stderr)
+            return 1
+        
+        try:
+            pretty_print(file_path, in_place=args.in_place)
+        except json.JSONDecodeError as e:
+            print(f"❌ فایل JSON نامعتبر: {file_path} ({str(e)})", file=sys.stderr)
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -6,10 +6,18 @@ Orchestrates the complete document processing pipeline from raw DOCX to processe
 
 import sys
 import argparse
+import functools
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import cpu_count
+from multiprocessing.pool import Pool
 from pathlib import Path
 from datetime import datetime
 import json
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+from tqdm import tqdm
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
@@ -21,7 +29,215 @@ from src.data_processing.document_parser import LegalDocumentParser
 from src.data_processing.text_processor import AdvancedTextProcessor
 from src.data_processing.chunker import IntelligentChunker
 from src.data_processing.metadata_generator import MetadataGenerator
-from src.core.models import LegalDocument, ProcessingReport, ProcessingStatus
+from src.core.models import LegalDocument, DocumentMetadata, ProcessingReport, ProcessingStatus
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> LegalDocumentParser:
+    """
+    Get the worker-local document parser (created once per worker process)
+    """
+    return LegalDocumentParser()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_text_processor() -> AdvancedTextProcessor:
+    """
+    Get the worker-local text processor (created once per worker process)
+    """
+    return AdvancedTextProcessor()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_chunker() -> IntelligentChunker:
+    """
+    Get the worker-local chunker (created once per worker process)
+    """
+    return IntelligentChunker()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_metadata_generator() -> MetadataGenerator:
+    """
+    Get the worker-local metadata generator (created once per worker process)
+    """
+    return MetadataGenerator()
+
+
+def _worker_init() -> None:
+    """
+    Pool initializer: build each worker's processors once, before the first task
+    """
+    _get_parser()
+    _get_text_processor()
+    _get_chunker()
+    _get_metadata_generator()
+
+
+def _shard(items: List, n_shards: int) -> List[List]:
+    """
+    Split items into at most n_shards contiguous, roughly equal shards
+    """
+    if not items:
+        return []
+    
+    shard_size = math.ceil(len(items) / max(n_shards, 1))
+    return [items[i:i + shard_size] for i in range(0, len(items), shard_size)]
+
+
+def _merge_reports(operation_type: str, reports: List[ProcessingReport], total_items: int) -> ProcessingReport:
+    """
+    Combine the processing reports returned by shard workers into one report
+    """
+    merged = ProcessingReport(
+        operation_type=operation_type,
+        total_items=total_items
+    )
+    
+    for report in reports:
+        merged.processed_items += report.processed_items
+        merged.failed_items += report.failed_items
+        merged.errors.extend(report.errors)
+        merged.warnings.extend(report.warnings)
+    
+    merged.finish()
+    return merged
+
+
+def _stats_delta(before: Dict, after: Dict) -> Dict:
+    """
+    Compute the change in numeric statistics between two snapshots
+    """
+    return {
+        key: value - before.get(key, 0)
+        for key, value in after.items()
+        if isinstance(value, (int, float))
+    }
+
+
+def _merge_stats(target: Dict, delta: Dict) -> None:
+    """
+    Add a statistics delta returned by a worker into the parent's statistics
+    """
+    for key, value in delta.items():
+        target[key] = target.get(key, 0) + value
+
+
+def _write_json(file_path: Path, data: Dict) -> None:
+    """
+    Write a JSON document to file
+    """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def _write_json_stream(file_path: Path, metadata: Dict, records_key: str, records: List) -> None:
+    """
+    Write {"metadata": ..., records_key: [...]} serializing one record at a time
+    
+    Args:
+        file_path (Path): Output JSON file
+        metadata (Dict): Metadata block written before the records
+        records_key (str): Key of the records array
+        records (List): Pydantic models to serialize (each via model_dump_json)
+    """
+    with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write('{"metadata": ')
+        f.write(json.dumps(metadata, ensure_ascii=False))
+        f.write(f', "{records_key}": [')
+        
+        for i, record in enumerate(records):
+            if i:
+                f.write(', ')
+            f.write(record.model_dump_json())
+        
+        f.write(']}')
+
+
+def _parse_one(item: Tuple[int, Dict]) -> Tuple[int, bool, object, Dict]:
+    """
+    Parse a single law inside a worker process
+    
+    Args:
+        item (Tuple[int, Dict]): (input index, individual law metadata)
+        
+    Returns:
+        Tuple[int, bool, object, Dict]: (input index, ok, parsed document or error message, parser stats delta)
+    """
+    index, law_data = item
+    parser = _get_parser()
+    stats_before = parser.get_parsing_statistics()
+    
+    try:
+        parsed_doc = parser.parse_document_from_dict(law_data)
+        result = (True, parser.to_legal_document(parsed_doc, law_data.get('raw_content')))
+    except Exception as e:
+        result = (False, f"{law_data.get('id', 'نامشخص')}: {str(e)}")
+    
+    return (index,) + result + (_stats_delta(stats_before, parser.get_parsing_statistics()),)
+
+
+def _text_process_shard(documents: List[LegalDocument]) -> Tuple[List[LegalDocument], ProcessingReport, Dict]:
+    """
+    Clean the text of one shard of documents inside a worker process
+    
+    Returns:
+        Tuple: (processed documents, shard report, text processor stats delta)
+    """
+    processor = _get_text_processor()
+    stats_before = processor.get_processing_statistics()
+    
+    processed_docs, report = processor.process_legal_documents(documents)
+    
+    return processed_docs, report, _stats_delta(stats_before, processor.get_processing_statistics())
+
+
+def _chunk_shard(documents: List[LegalDocument]) -> Tuple[List, ProcessingReport, Dict]:
+    """
+    Chunk one shard of documents inside a worker process
+    
+    Returns:
+        Tuple: (chunks, shard report, chunker stats delta)
+    """
+    chunker = _get_chunker()
+    stats_before = chunker.chunking_stats.copy()
+    
+    # Already inside a pool worker, so chunk in this process
+    chunks, report = chunker.chunk_documents_batch(documents, max_workers=1)
+    
+    return chunks, report, _stats_delta(stats_before, chunker.chunking_stats)
+
+
+def _process_and_chunk_shard(documents: List[LegalDocument]) -> Tuple[Tuple, Tuple]:
+    """
+    Clean and then chunk one shard of documents inside a worker process
+    
+    Fusing the two steps means the processed documents are pickled back to
+    the parent once, instead of once per phase plus again for chunking.
+    
+    Returns:
+        Tuple: (_text_process_shard result, _chunk_shard result)
+    """
+    text_result = _text_process_shard(documents)
+    return text_result, _chunk_shard(text_result[0])
+
+
+def _gen_doc_meta(document: LegalDocument) -> Tuple[bool, object, Dict]:
+    """
+    Generate metadata for a single document inside a worker process
+    
+    Returns:
+        Tuple: (ok, document metadata or error message, metadata generator stats delta)
+    """
+    generator = _get_metadata_generator()
+    stats_before = generator.generation_stats.copy()
+    
+    try:
+        result = (True, generator.generate_document_metadata(document))
+    except Exception as e:
+        result = (False, repr(e))
+    
+    return result + (_stats_delta(stats_before, generator.generation_stats),)
 
 
 class DocumentProcessingPipeline:
@@ -39,22 +255,65 @@ class DocumentProcessingPipeline:
             'total_documents': 0,
             'successful_documents': 0,
             'failed_documents': 0,
-            'total_chunks': 0
+            'total_chunks': 0,
+            'errors': []
         }
+        # Monotonic start point for durations; start_time is for display only
+        self._start_perf = time.perf_counter()
+        # OUTPUT_FILES keys written during this run (avoids re-stat'ing outputs)
+        self._written_files = set()
         
         # Initialize processors
         self.splitter = DocumentSplitter()
+        self.splitter_stats = {}
         self.parser = LegalDocumentParser()
         self.text_processor = AdvancedTextProcessor()
         self.chunker = IntelligentChunker()
         self.metadata_generator = MetadataGenerator()
+        
+        # Worker pool shared by phases 1-5 (created on first use, see close())
+        self._pool = None
     
-    def phase_1_split_documents(self, input_file: str) -> List[Dict]:
+    def _record_errors(self, phase: str, errors: List[str]) -> None:
         """
-        Phase 1.1: Split main document into individual laws
+        Append per-item errors reported by workers to pipeline_stats['errors']
+        
+        Args:
+            phase (str): Phase that produced the errors
+            errors (List[str]): Error messages
+        """
+        for error in errors:
+            self.pipeline_stats['errors'].append({'phase': phase, 'error': error})
+    
+    def _get_pool(self) -> Pool:
+        """
+        Get the persistent worker pool, starting it on first use
+        
+        Returns:
+            Pool: Worker pool whose processes already hold warm processors
+        """
+        if self._pool is None:
+            self._pool = Pool(initializer=_worker_init)
+        return self._pool
+    
+    def close(self) -> None:
+        """
+        Shut down the worker pool (if started) and wait for its processes
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+    
+    def phase_1_split_documents(self, input_files: List[str]) -> List[Dict]:
+        """
+        Phase 1.1: Split input documents into individual laws
+        
+        Each file is split sequentially and the laws of all files are
+        combined, so the following phases process them as one batch.
         
         Args:
-            input_file (str): Path to input DOCX file
+            input_files (List[str]): Paths to input DOCX files
             
         Returns:
             List[Dict]: Individual law metadata
@@ -63,22 +322,46 @@ class DocumentProcessingPipeline:
         print("🔄 فاز ۱.۱: تفکیک خودکار قوانین")
         print("="*60)
         
-        phase_start = datetime.now()
+        phase_start = time.perf_counter()
+        laws_data = []
+        combined_laws = []
         
         try:
-            # Split documents
-            result = self.splitter.split_document(input_file)
+            for file_index, input_file in enumerate(input_files):
+                # Split each file with fresh counters, then aggregate; the
+                # combined laws are saved once after the loop
+                self.splitter.processing_stats = dict.fromkeys(self.splitter.processing_stats, 0)
+                result = self.splitter.split_document(input_file, save_results=False, pool=self._get_pool())
+                
+                if not result['success']:
+                    raise Exception(result['error'])
+                
+                file_laws = result['laws']
+                
+                # Law IDs restart in every file, and file stems can repeat
+                # across directories; prefix with the file's position as well
+                if len(input_files) > 1:
+                    file_key = f"{file_index + 1}_{Path(input_file).stem}"
+                    for law, law_data in zip(self.splitter.laws, file_laws):
+                        law.id = law_data['id'] = f"{file_key}_{law.id}"
+                
+                laws_data.extend(file_laws)
+                combined_laws.extend(self.splitter.laws)
+                _merge_stats(self.splitter_stats, result['stats'])
+            
+            # Save the laws of all files together, with their final IDs
+            self.splitter.laws = combined_laws
+            self.splitter.processing_stats = dict(self.splitter_stats)
+            if self.splitter.save_individual_laws():
+                self._written_files.add('individual_laws')
+            self.splitter.save_processing_report()
             
-            if not result['success']:
-                raise Exception(result['error'])
-            
-            laws_data = result['laws']
             self.pipeline_stats['total_documents'] = len(laws_data)
             
             print(f"✅ تفکیک کامل شد: {len(laws_data)} قانون استخراج شد")
             
             # Record phase time
-            phase_time = (datetime.now() - phase_start).total_seconds()
+            phase_time = time.perf_counter() - phase_start
             self.pipeline_stats['phase_times']['split'] = phase_time
             
             return laws_data
@@ -101,28 +384,38 @@ class DocumentProcessingPipeline:
         print("🔄 فاز ۱.۲: تجزیه ساختار اسناد")
         print("="*60)
         
-        phase_start = datetime.now()
-        parsed_documents = []
+        phase_start = time.perf_counter()
+        # One slot per input law; workers finish out of order, so write by index
+        slots = [None] * len(laws_data)
         
         try:
-            for i, law_data in enumerate(laws_data):
-                try:
-                    # Parse individual law
-                    parsed_doc = self.parser.parse_document(law_data)
-                    parsed_documents.append(parsed_doc)
-                    
-                    print(f"✓ تجزیه شد ({i+1}/{len(laws_data)}): {parsed_doc.title[:50]}...")
-                    
-                except Exception as e:
-                    print(f"✗ خطا در تجزیه سند {i+1}: {str(e)}")
+            # Parse laws in parallel; each worker keeps its own parser
+            chunksize = max(1, len(laws_data) // (cpu_count() + 2))
+            
+            results = self._get_pool().imap_unordered(_parse_one, enumerate(laws_data), chunksize=chunksize)
+            
+            for index, ok, result, stats in tqdm(results, total=len(laws_data), desc='parse'):
+                _merge_stats(self.parser.parsing_stats, stats)
+                
+                if ok:
+                    slots[index] = result
+                else:
+                    tqdm.write(f"✗ خطا در تجزیه سند {result}")
                     self.pipeline_stats['failed_documents'] += 1
+                    self.pipeline_stats['errors'].append({'phase': 'parse', 'law_idx': index, 'error': result})
+            
+            parsed_documents = [doc for doc in slots if doc is not None]
+            
+            # Individual failures are tolerated; only a fully failed batch is fatal
+            if laws_data and not parsed_documents:
+                raise Exception(f"تجزیه هیچ‌یک از {len(laws_data)} سند موفق نبود")
             
             self.pipeline_stats['successful_documents'] = len(parsed_documents)
             
             print(f"✅ تجزیه کامل شد: {len(parsed_documents)} سند تجزیه شد")
             
             # Record phase time
-            phase_time = (datetime.now() - phase_start).total_seconds()
+            phase_time = time.perf_counter() - phase_start
             self.pipeline_stats['phase_times']['parse'] = phase_time
             
             return parsed_documents
@@ -131,6 +424,60 @@ class DocumentProcessingPipeline:
             print(f"❌ خطا در فاز تجزیه: {str(e)}")
             raise
     
+    def _collect_text_results(self, shard_results: List[Tuple], total_items: int) -> List[LegalDocument]:
+        """
+        Combine _text_process_shard results: merge stats, record errors and print the summary
+        
+        Args:
+            shard_results (List[Tuple]): (documents, report, stats delta) per shard
+            total_items (int): Number of documents sent to the shards
+            
+        Returns:
+            List[LegalDocument]: Processed documents in shard order
+        """
+        processed_docs, shard_reports = [], []
+        for shard_docs, shard_report, stats in shard_results:
+            processed_docs.extend(shard_docs)
+            shard_reports.append(shard_report)
+            _merge_stats(self.text_processor.processing_stats, stats)
+        
+        report = _merge_reports("text_processing", shard_reports, total_items)
+        self._record_errors('text_process', report.errors)
+        
+        print(f"✅ پردازش متن کامل شد:")
+        print(f"   - موفق: {report.processed_items}")
+        print(f"   - ناموفق: {report.failed_items}")
+        
+        return processed_docs
+    
+    def _collect_chunk_results(self, shard_results: List[Tuple], total_items: int) -> List:
+        """
+        Combine _chunk_shard results: merge stats, record errors and print the summary
+        
+        Args:
+            shard_results (List[Tuple]): (chunks, report, stats delta) per shard
+            total_items (int): Number of documents sent to the shards
+            
+        Returns:
+            List[TextChunk]: Chunks in shard order
+        """
+        chunks, shard_reports = [], []
+        for shard_chunks, shard_report, stats in shard_results:
+            chunks.extend(shard_chunks)
+            shard_reports.append(shard_report)
+            _merge_stats(self.chunker.chunking_stats, stats)
+        
+        report = _merge_reports("text_chunking", shard_reports, total_items)
+        self._record_errors('chunk', report.errors)
+        
+        self.pipeline_stats['total_chunks'] = len(chunks)
+        
+        print(f"✅ تقسیم متن کامل شد:")
+        print(f"   - اسناد پردازش شده: {report.processed_items}")
+        print(f"   - کل chunks ایجاد شده: {len(chunks)}")
+        
+        return chunks
+    
     def phase_3_process_text(self, documents: List[LegalDocument]) -> List[LegalDocument]:
         """
         Phase 1.3: Process and clean text
@@ -145,18 +492,15 @@ class DocumentProcessingPipeline:
         print("🔄 فاز ۱.۳: پردازش و تمیزکاری متون")
         print("="*60)
         
-        phase_start = datetime.now()
+        phase_start = time.perf_counter()
         
         try:
-            # Process documents in batch
-            processed_docs, report = self.text_processor.process_documents_batch(documents)
-            
-            print(f"✅ پردازش متن کامل شد:")
-            print(f"   - موفق: {report.processed_items}")
-            print(f"   - ناموفق: {report.failed_items}")
+            # Process document shards in parallel, one shard per worker
+            shard_results = self._get_pool().map(_text_process_shard, _shard(documents, cpu_count()))
+            processed_docs = self._collect_text_results(shard_results, len(documents))
             
             # Record phase time
-            phase_time = (datetime.now() - phase_start).total_seconds()
+            phase_time = time.perf_counter() - phase_start
             self.pipeline_stats['phase_times']['text_process'] = phase_time
             
             return processed_docs
@@ -179,20 +523,15 @@ class DocumentProcessingPipeline:
         print("🔄 فاز ۱.۴: تقسیم هوشمند متون")
         print("="*60)
         
-        phase_start = datetime.now()
+        phase_start = time.perf_counter()
         
         try:
-            # Chunk documents in batch
-            chunks, report = self.chunker.chunk_documents_batch(documents)
-            
-            self.pipeline_stats['total_chunks'] = len(chunks)
-            
-            print(f"✅ تقسیم متن کامل شد:")
-            print(f"   - اسناد پردازش شده: {report.processed_items}")
-            print(f"   - کل chunks ایجاد شده: {len(chunks)}")
+            # Chunk document shards in parallel, one shard per worker
+            shard_results = self._get_pool().map(_chunk_shard, _shard(documents, cpu_count()))
+            chunks = self._collect_chunk_results(shard_results, len(documents))
             
             # Record phase time
-            phase_time = (datetime.now() - phase_start).total_seconds()
+            phase_time = time.perf_counter() - phase_start
             self.pipeline_stats['phase_times']['chunk'] = phase_time
             
             return chunks
@@ -201,6 +540,38 @@ class DocumentProcessingPipeline:
             print(f"❌ خطا در فاز تقسیم متن: {str(e)}")
             raise
     
+    def phase_34_process_and_chunk(self, documents: List[LegalDocument]) -> Tuple[List[LegalDocument], List]:
+        """
+        Phases 1.3 + 1.4 fused: process text and chunk in a single worker pass
+        
+        Args:
+            documents (List[LegalDocument]): Parsed documents
+            
+        Returns:
+            Tuple[List[LegalDocument], List[TextChunk]]: Processed documents and generated chunks
+        """
+        print("\n" + "="*60)
+        print("🔄 فاز ۱.۳ و ۱.۴: پردازش متون و تقسیم هوشمند")
+        print("="*60)
+        
+        phase_start = time.perf_counter()
+        
+        try:
+            # Each worker cleans and chunks its shard without a round trip in between
+            shard_results = self._get_pool().map(_process_and_chunk_shard, _shard(documents, cpu_count()))
+            processed_docs = self._collect_text_results([text for text, _ in shard_results], len(documents))
+            chunks = self._collect_chunk_results([chunk for _, chunk in shard_results], len(processed_docs))
+            
+            # Record phase time
+            phase_time = time.perf_counter() - phase_start
+            self.pipeline_stats['phase_times']['text_process_chunk'] = phase_time
+            
+            return processed_docs, chunks
+        
+        except Exception as e:
+            print(f"❌ خطا در فاز پردازش و تقسیم متن: {str(e)}")
+            raise
+    
     def phase_5_generate_metadata(self, documents: List[LegalDocument], chunks: List) -> Dict:
         """
         Phase 1.5: Generate comprehensive metadata
@@ -216,22 +587,31 @@ class DocumentProcessingPipeline:
         print("🔄 فاز ۱.۵: تولید اطلاعات کمکی")
         print("="*60)
         
-        phase_start = datetime.now()
+        phase_start = time.perf_counter()
         
         try:
             # Generate comprehensive metadata
             metadata_summary = self.metadata_generator.generate_processing_summary(documents, chunks)
             
-            # Update document metadata
-            for doc in documents:
-                doc.metadata = self.metadata_generator.generate_document_metadata(doc)
+            # Update document metadata in parallel
+            chunksize = max(1, len(documents) // (cpu_count() + 2))
+            new_metadata = self._get_pool().map(_gen_doc_meta, documents, chunksize=chunksize)
+            
+            for doc, (ok, result, stats) in zip(documents, new_metadata):
+                _merge_stats(self.metadata_generator.generation_stats, stats)
+                
+                if ok:
+                    doc.metadata = result
+                else:
+                    # Keep the document's existing metadata
+                    self.pipeline_stats['errors'].append({'phase': 'metadata', 'doc_id': doc.id, 'error': result})
             
             print(f"✅ تولید metadata کامل شد:")
             print(f"   - کیفیت متوسط: {metadata_summary['quality_statistics']['average_quality']:.2f}")
             print(f"   - اسناد با کیفیت بالا: {metadata_summary['quality_statistics']['high_quality_documents']}")
             
             # Record phase time
-            phase_time = (datetime.now() - phase_start).total_seconds()
+            phase_time = time.perf_counter() - phase_start
             self.pipeline_stats['phase_times']['metadata'] = phase_time
             
             return metadata_summary
@@ -254,44 +634,49 @@ class DocumentProcessingPipeline:
         print("="*60)
         
         try:
-            # Save processed documents
-            documents_data = {
-                'metadata': {
-                    'total_documents': len(documents),
-                    'processing_date': datetime.now().isoformat(),
-                    'pipeline_version': '1.0'
-                },
-                'documents': [doc.dict() for doc in documents]
-            }
-            
-            with open(OUTPUT_FILES['processed_documents'], 'w', encoding='utf-8') as f:
-                json.dump(documents_data, f, ensure_ascii=False, indent=2)
-            print(f"✓ اسناد پردازش شده: {OUTPUT_FILES['processed_documents']}")
-            
-            # Save chunks
-            chunks_data = {
-                'metadata': {
-                    'total_chunks': len(chunks),
-                    'creation_date': datetime.now().isoformat(),
-                    'chunking_config': {
-                        'min_size': self.chunker.min_chunk_size,
-                        'max_size': self.chunker.max_chunk_size,
-                        'overlap': self.chunker.chunk_overlap
-                    }
-                },
-                'chunks': [chunk.dict() for chunk in chunks]
-            }
-            
-            with open(OUTPUT_FILES['chunks'], 'w', encoding='utf-8') as f:
-                json.dump(chunks_data, f, ensure_ascii=False, indent=2)
-            print(f"✓ Chunks: {OUTPUT_FILES['chunks']}")
-            
-            # Save metadata
-            with open(OUTPUT_FILES['metadata'], 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
-            print(f"✓ Metadata: {OUTPUT_FILES['metadata']}")
-            
-            # Save final processing report
+            # One timestamp for every file written by this save
+            now_iso = datetime.now().isoformat()
+            
+            # Write the output files concurrently; file writes release the GIL
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                writes = [
+                    ('processed_documents', 'اسناد پردازش شده', executor.submit(
+                        _write_json_stream,
+                        OUTPUT_FILES['processed_documents'],
+                        {
+                            'total_documents': len(documents),
+                            'processing_date': now_iso,
+                            'pipeline_version': '1.0'
+                        },
+                        'documents',
+                        documents
+                    )),
+                    ('chunks', 'Chunks', executor.submit(
+                        _write_json_stream,
+                        OUTPUT_FILES['chunks'],
+                        {
+                            'total_chunks': len(chunks),
+                            'creation_date': now_iso,
+                            'chunking_config': {
+                                'min_size': self.chunker.min_chunk_size,
+                                'max_size': self.chunker.max_chunk_size,
+                                'overlap': self.chunker.chunk_overlap
+                            }
+                        },
+                        'chunks',
+                        chunks
+                    )),
+                    ('metadata', 'Metadata', executor.submit(
+                        _write_json, OUTPUT_FILES['metadata'], metadata
+                    ))
+                ]
+                
+                for file_type, label, future in writes:
+                    future.result()
+                    self._written_files.add(file_type)
+                    print(f"✓ {label}: {OUTPUT_FILES[file_type]}")
+            
+            # Save final processing report (after the writes, so its timing covers them)
             self.save_final_report()
             
         except Exception as e:
@@ -303,9 +688,7 @@ class DocumentProcessingPipeline:
         Save final processing report
         """
         self.pipeline_stats['end_time'] = datetime.now()
-        self.pipeline_stats['total_processing_time'] = (
-            self.pipeline_stats['end_time'] - self.pipeline_stats['start_time']
-        ).total_seconds()
+        self.pipeline_stats['total_processing_time'] = time.perf_counter() - self._start_perf
         
         # Create comprehensive report
         final_report = {
@@ -320,30 +703,34 @@ class DocumentProcessingPipeline:
             },
             'statistics': self.pipeline_stats,
             'processor_stats': {
-                'splitter': self.splitter.processing_stats,
+                'splitter': self.splitter_stats,
                 'parser': self.parser.get_parsing_statistics(),
                 'text_processor': self.text_processor.get_processing_statistics(),
                 'chunker': self.chunker.get_chunking_statistics(),
                 'metadata_generator': self.metadata_generator.generation_stats
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self.pipeline_stats['end_time'].isoformat()
         }
         
         with open(OUTPUT_FILES['processing_report'], 'w', encoding='utf-8') as f:
-            json.dump(final_report, f, ensure_ascii=False, indent=2)
+            json.dump(final_report, f, ensure_ascii=False)
+        self._written_files.add('processing_report')
         
         print(f"✓ گزارش نهایی: {OUTPUT_FILES['processing_report']}")
     
-    def run_complete_pipeline(self, input_file: str) -> Dict:
+    def run_complete_pipeline(self, input_files: List[str]) -> Dict:
         """
         Run the complete document processing pipeline
         
         Args:
-            input_file (str): Path to input DOCX file
+            input_files (List[str]): Paths to input DOCX files (a single path is also accepted)
             
         Returns:
             Dict: Pipeline results
         """
+        if isinstance(input_files, (str, Path)):
+            input_files = [input_files]
+        
         print("\n" + "🚀" + "="*58 + "🚀")
         print("    آغاز پردازش کامل اسناد حقوقی - فاز ۱")
         print("🚀" + "="*58 + "🚀")
@@ -354,16 +741,13 @@ class DocumentProcessingPipeline:
                 raise Exception("تنظیمات سیستم نامعتبر است")
             
             # Phase 1.1: Split documents
-            laws_data = self.phase_1_split_documents(input_file)
+            laws_data = self.phase_1_split_documents(input_files)
             
             # Phase 1.2: Parse documents
             documents = self.phase_2_parse_documents(laws_data)
             
-            # Phase 1.3: Process text
-            processed_documents = self.phase_3_process_text(documents)
-            
-            # Phase 1.4: Create chunks
-            chunks = self.phase_4_chunk_documents(processed_documents)
+            # Phases 1.3 + 1.4: Process text and create chunks (fused)
+            processed_documents, chunks = self.phase_34_process_and_chunk(documents)
             
             # Phase 1.5: Generate metadata
             metadata = self.phase_5_generate_metadata(processed_documents, chunks)
@@ -387,8 +771,11 @@ class DocumentProcessingPipeline:
             return {
                 'success': False,
                 'error': str(e),
-                'processing_time': (datetime.now() - self.pipeline_stats['start_time']).total_seconds()
+                'processing_time': time.perf_counter() - self._start_perf
             }
+        
+        finally:
+            self.close()
     
     def print_final_summary(self) -> None:
         """
@@ -418,7 +805,7 @@ class DocumentProcessingPipeline:
         
         print(f"\n📂 فایل‌های خروجی:")
         for file_type, file_path in OUTPUT_FILES.items():
-            if file_path.exists():
+            if file_type in self._written_files:
                 print(f"   ✅ {file_type}: {file_path}")
             else:
                 print(f"   ❌ {file_type}: فایل ایجاد نشد")
@@ -433,22 +820,23 @@ def main():
     Main function for command line execution
     """
     parser = argparse.ArgumentParser(description='Legal Assistant Document Processing Pipeline')
-    parser.add_argument('input_file', help='Path to input DOCX file (Part2_Legals.docx)')
+    parser.add_argument('input_files', nargs='+', help='Path(s) to input DOCX file(s) (Part2_Legals.docx)')
     parser.add_argument('--output-dir', help='Output directory (default: data/processed)')
     parser.add_argument('--config', help='Configuration file path')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
     
-    # Validate input file
-    input_path = Path(args.input_file)
-    if not input_path.exists():
-        print(f"❌ فایل ورودی پیدا نشد: {input_path}")
-        return 1
-    
-    if not input_path.suffix.lower() == '.docx':
-        print(f"❌ فرمت فایل باید DOCX باشد: {input_path}")
-        return 1
+    # Validate input files
+    input_paths = [Path(input_file) for input_file in args.input_files]
+    for input_path in input_paths:
+        if not input_path.exists():
+            print(f"❌ فایل ورودی پیدا نشد: {input_path}")
+            return 1
+        
+        if not input_path.suffix.lower() == '.docx':
+            print(f"❌ فرمت فایل باید DOCX باشد: {input_path}")
+            return 1
     
     try:
         # Load custom config if provided
@@ -459,7 +847,7 @@ def main():
         
         # Initialize and run pipeline
         pipeline = DocumentProcessingPipeline(config)
-        result = pipeline.run_complete_pipeline(str(input_path))
+        result = pipeline.run_complete_pipeline([str(input_path) for input_path in input_paths])
         
         if result['success']:
             print(f"\n🎉 پردازش با موفقیت تکمیل شد!")
@@ -1 +1,31 @@
- 
+# ===============================================
+# src/comparison/__init__.py
+# ===============================================
+"""
+Document comparison modules for Legal Assistant
+Contains similarity analysis and document comparison tools
+
+Note: This package will be implemented in Phase 3
+"""
+
+# Placeholder for Phase 3 development
+__version__ = "0.0.0"
+__status__ = "planned"
+
+# Future imports (to be implemented in Phase 3)
+# from .document_comparator import DocumentComparator
+# from .similarity_analyzer import SimilarityAnalyzer
+
+__all__ = []
+
+def get_phase_info():
+    """Get information about comparison module development status"""
+    return {
+        "phase": 3,
+        "status": "not_implemented", 
+        "description": "Document comparison functionality will be available in Phase 3",
+        "planned_modules": [
+            "document_comparator.py",
+            "similarity_analyzer.py"
+        ]
+    }
@@ -1 +1,96 @@
- 
+# ===============================================
+# src/core/__init__.py
+# ===============================================
+"""
+Core modules for Legal Assistant
+Contains configuration, models, and base utilities
+
+Submodules are imported lazily on first attribute access (PEP 562).
+"""
+
+import importlib
+
+# Submodule -> names it exports
+_SUBMODULE_EXPORTS = {
+    'config': ('get_config', 'validate_config', 'OUTPUT_FILES', 'PROJECT_ROOT'),
+    'models': (
+        # Enums
+        'DocumentType', 'ApprovalAuthority', 'SubsectionType', 'ProcessingStatus', 'ChunkType',
+        
+        # Base Models
+        'BaseEntity',
+        
+        # Legal Structure Models
+        'LegalSubsection', 'LegalNote', 'LegalArticle', 'LegalChapter',
+        
+        # Document Models
+        'DocumentMetadata', 'LegalDocument',
+        
+        # Chunking Models
+        'TextChunk',
+        
+        # Processing Models
+        'ProcessingReport', 'QualityAssessment',
+        
+        # Search Models
+        'SearchQuery', 'SearchResult',
+        
+        # Configuration Models
+        'ProcessingConfig', 'EmbeddingModel', 'VectorStoreConfig', 'RAGConfig',
+        
+        # Utility Functions
+        'validate_persian_date', 'create_chunk_id', 'create_document_id',
+        'map_approval_authority', 'map_document_type'
+    ),
+}
+
+_LAZY_IMPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+__all__ = [
+    # Configuration
+    'get_config', 'validate_config', 'OUTPUT_FILES', 'PROJECT_ROOT',
+    
+    # Enums
+    'DocumentType', 'ApprovalAuthority', 'SubsectionType', 'ProcessingStatus', 'ChunkType',
+    
+    # Base Models
+    'BaseEntity',
+    
+    # Legal Structure Models
+    'LegalSubsection', 'LegalNote', 'LegalArticle', 'LegalChapter',
+    
+    # Document Models
+    'DocumentMetadata', 'LegalDocument',
+    
+    # Chunking Models
+    'TextChunk',
+    
+    # Processing Models
+    'ProcessingReport', 'QualityAssessment',
+    
+    # Search Models
+    'SearchQuery', 'SearchResult',
+    
+    # Configuration Models
+    'ProcessingConfig', 'EmbeddingModel', 'VectorStoreConfig', 'RAGConfig',
+    
+    # Utility Functions
+    'validate_persian_date', 'create_chunk_id', 'create_document_id',
+    'map_approval_authority', 'map_document_type'
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,9 +4,12 @@ Core configuration settings for Legal Assistant AI
 Manages all system-wide configurations and constants
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 import os
+import re
 
 # Project structure configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -44,6 +47,13 @@ DOCUMENT_CONFIG = {
     "english_digits": "0123456789",
 }
 
+# Precompiled document patterns (compiled once per process, MULTILINE)
+COMPILED_PATTERNS = {
+    key: re.compile(pattern, re.MULTILINE)
+    for key, pattern in DOCUMENT_CONFIG.items()
+    if key.endswith("_pattern") or key == "law_separator"
+}
+
 # Text cleaning configuration
 TEXT_CLEANING = {
     # Characters to normalize
@@ -116,14 +126,18 @@ QUALITY_ASSURANCE = {
     "check_completeness": True,
 }
 
-def get_config() -> Dict:
+@lru_cache(maxsize=1)
+def get_config() -> Mapping:
     """
     Get complete configuration dictionary
     
+    The result is built once and cached; it is returned as a read-only
+    mapping so callers cannot mutate the shared instance.
+    
     Returns:
-        Dict: Complete configuration settings
+        Mapping: Complete configuration settings
     """
-    return {
+    return MappingProxyType({
         "document": DOCUMENT_CONFIG,
         "text_cleaning": TEXT_CLEANING,
         "metadata": METADATA_CONFIG,
@@ -131,12 +145,16 @@ def get_config() -> Dict:
         "logging": LOGGING_CONFIG,
         "persian": PERSIAN_CONFIG,
         "quality": QUALITY_ASSURANCE,
-    }
+    })
 
+@lru_cache(maxsize=1)
 def validate_config() -> bool:
     """
     Validate configuration settings and directory structure
     
+    The result is cached for the lifetime of the process; call
+    validate_config.cache_clear() to re-validate after a config reload.
+    
     Returns:
         bool: True if configuration is valid
     """
@@ -4,11 +4,43 @@ Pydantic data models for Legal Assistant
 Defines all data structures used throughout the system
 """
 
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 from typing import List, Dict, Optional, Union, Any
 from datetime import datetime
 from enum import Enum
 import re
+import time
+
+
+# Accepted Persian date formats: d/m/yy or d/m/yyyy. \d matches any Unicode
+# decimal digit, so ASCII and Persian digits are both covered.
+_PERSIAN_DATE_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{2}(?:\d{2})?$')
+
+# Patterns used by create_document_id
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
+
+def _strip_if_needed(v: str) -> str:
+    """Strip surrounding whitespace, returning ``v`` itself when already clean"""
+    if v[0].isspace() or v[-1].isspace():
+        return v.strip()
+    return v
+
+
+def _construct_picklable(cls, fields: Dict[str, Any]) -> BaseModel:
+    """
+    model_construct for models that define model_post_init
+    
+    Pydantic 2.5's model_construct leaves __pydantic_private__ unset on such
+    models, which makes the instance fail to pickle (e.g. when chunks are
+    returned from worker processes).
+    """
+    instance = cls.model_construct(**fields)
+    if not hasattr(instance, '__pydantic_private__'):
+        object.__setattr__(instance, '__pydantic_private__', None)
+    return instance
 
 
 class DocumentType(str, Enum):
@@ -61,52 +93,51 @@ class BaseEntity(BaseModel):
     id: str = Field(..., description="Unique identifier")
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: Optional[datetime] = None
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 # Legal Structure Models
 class LegalSubsection(BaseModel):
     """Represents a subsection within an article"""
+    model_config = ConfigDict(frozen=True)
+    
     number: str = Field(..., description="Subsection number or identifier")
     content: str = Field(..., description="Subsection content")
     type: SubsectionType = Field(..., description="Type of subsection")
     keywords: List[str] = Field(default_factory=list, description="Extracted keywords")
     
-    @validator('content')
+    @field_validator('content')
+    @classmethod
     def content_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             raise ValueError('محتوای بند نمی‌تواند خالی باشد')
-        return v.strip()
+        return _strip_if_needed(v)
     
-    @validator('keywords', always=True)
-    def ensure_keywords_list(cls, v):
-        return v if v is not None else []
+    @classmethod
+    def fast_build(cls, **fields) -> "LegalSubsection":
+        """Build without validation (trusted callers only, see TextChunk.fast_build)"""
+        return cls.model_construct(**fields)
 
 
 class LegalNote(BaseModel):
     """Represents a note (تبصره) within an article"""
+    model_config = ConfigDict(frozen=True)
+    
     number: str = Field(..., description="Note number or identifier")
     content: str = Field(..., description="Note content")
     subsections: List[LegalSubsection] = Field(default_factory=list)
     keywords: List[str] = Field(default_factory=list)
     
-    @validator('content')
+    @field_validator('content')
+    @classmethod
     def content_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             raise ValueError('محتوای تبصره نمی‌تواند خالی باشد')
-        return v.strip()
-    
-    @validator('keywords', always=True)
-    def ensure_keywords_list(cls, v):
-        return v if v is not None else []
+        return _strip_if_needed(v)
     
-    @validator('subsections', always=True)
-    def ensure_subsections_list(cls, v):
-        return v if v is not None else []
+    @classmethod
+    def fast_build(cls, **fields) -> "LegalNote":
+        """Build without validation (trusted callers only, see TextChunk.fast_build)"""
+        return cls.model_construct(**fields)
 
 
 class LegalArticle(BaseModel):
@@ -119,33 +150,22 @@ class LegalArticle(BaseModel):
     keywords: List[str] = Field(default_factory=list)
     word_count: Optional[int] = Field(None, description="Word count")
     
-    @validator('content')
+    @field_validator('content')
+    @classmethod
     def content_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             raise ValueError('محتوای ماده نمی‌تواند خالی باشد')
-        return v.strip()
-    
-    @validator('word_count', always=True)
-    def calculate_word_count(cls, v, values):
-        if 'content' in values and values['content']:
-            return len(values['content'].split())
-        return 0
-    
-    @validator('title', always=True)
-    def ensure_title_string(cls, v):
-        return v if v is not None else ""
-    
-    @validator('keywords', always=True)
-    def ensure_keywords_list(cls, v):
-        return v if v is not None else []
+        return _strip_if_needed(v)
     
-    @validator('subsections', always=True)
-    def ensure_subsections_list(cls, v):
-        return v if v is not None else []
+    @classmethod
+    def fast_build(cls, **fields) -> "LegalArticle":
+        """Build without validation (trusted callers only, see TextChunk.fast_build)"""
+        return _construct_picklable(cls, fields)
     
-    @validator('notes', always=True)
-    def ensure_notes_list(cls, v):
-        return v if v is not None else []
+    def model_post_init(self, __context: Any) -> None:
+        """Derive word_count from the (stripped) content unless it was given"""
+        if self.word_count is None:
+            self.__dict__['word_count'] = len(self.content.split())
 
 
 class LegalChapter(BaseModel):
@@ -155,14 +175,6 @@ class LegalChapter(BaseModel):
     articles: List[LegalArticle] = Field(default_factory=list)
     summary: Optional[str] = Field(None, description="Chapter summary")
     
-    @validator('title', always=True)
-    def ensure_title_string(cls, v):
-        return v if v is not None else ""
-    
-    @validator('articles', always=True)
-    def ensure_articles_list(cls, v):
-        return v if v is not None else []
-    
     @property
     def article_count(self) -> int:
         """Get number of articles in chapter"""
@@ -185,10 +197,6 @@ class DocumentMetadata(BaseModel):
     quality_score: float = Field(0.0, ge=0.0, le=1.0, description="Document quality score")
     processing_time: Optional[float] = Field(None, description="Processing time in seconds")
     extraction_errors: List[str] = Field(default_factory=list, description="Extraction errors")
-    
-    @validator('extraction_errors', always=True)
-    def ensure_errors_list(cls, v):
-        return v if v is not None else []
 
 
 class LegalDocument(BaseEntity):
@@ -204,41 +212,33 @@ class LegalDocument(BaseEntity):
     raw_content: Optional[str] = Field(None, description="Original raw content")
     status: ProcessingStatus = Field(ProcessingStatus.PENDING)
     
-    @validator('title')
+    @field_validator('title')
+    @classmethod
     def title_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             raise ValueError('عنوان سند نمی‌تواند خالی باشد')
-        return v.strip()
+        return _strip_if_needed(v)
     
-    @validator('approval_date')
+    @field_validator('approval_date')
+    @classmethod
     def approval_date_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             return "نامشخص"
-        return v.strip()
+        return _strip_if_needed(v)
     
-    @validator('approval_authority')
+    @field_validator('approval_authority')
+    @classmethod
     def approval_authority_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             return "نامشخص"
-        return v.strip()
+        return _strip_if_needed(v)
     
-    @validator('document_type')
+    @field_validator('document_type')
+    @classmethod
     def document_type_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             return "نامشخص"
-        return v.strip()
-    
-    @validator('chapters', always=True)
-    def ensure_chapters_list(cls, v):
-        return v if v is not None else []
-    
-    @validator('standalone_articles', always=True)
-    def ensure_standalone_articles_list(cls, v):
-        return v if v is not None else []
-    
-    @validator('footnotes', always=True)
-    def ensure_footnotes_list(cls, v):
-        return v if v is not None else []
+        return _strip_if_needed(v)
     
     @property
     def total_articles(self) -> int:
@@ -257,6 +257,8 @@ class LegalDocument(BaseEntity):
 # Chunking Models
 class TextChunk(BaseModel):
     """Represents a chunk of text for RAG"""
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(..., description="Chunk identifier")
     document_id: str = Field(..., description="Source document ID")
     content: str = Field(..., description="Chunk content")
@@ -268,35 +270,31 @@ class TextChunk(BaseModel):
     legal_references: List[str] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    @validator('content')
+    @field_validator('content')
+    @classmethod
     def content_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             raise ValueError('محتوای chunk نمی‌تواند خالی باشد')
-        return v.strip()
-    
-    @validator('word_count', always=True)
-    def calculate_word_count(cls, v, values):
-        if 'content' in values and values['content']:
-            return len(values['content'].split())
-        return 0
-    
-    @validator('character_count', always=True)
-    def calculate_character_count(cls, v, values):
-        if 'content' in values and values['content']:
-            return len(values['content'])
-        return 0
-    
-    @validator('keywords', always=True)
-    def ensure_keywords_list(cls, v):
-        return v if v is not None else []
+        return _strip_if_needed(v)
     
-    @validator('legal_references', always=True)
-    def ensure_legal_references_list(cls, v):
-        return v if v is not None else []
+    @classmethod
+    def fast_build(cls, **fields) -> "TextChunk":
+        """
+        Build without validation, for trusted internal producers only
+        
+        Skips validators and type coercion (content is neither checked for
+        emptiness nor stripped); callers must pass stripped, non-empty
+        content and correctly typed values (e.g. ChunkType members, not
+        strings). word_count/character_count are still derived when omitted.
+        """
+        return _construct_picklable(cls, fields)
     
-    @validator('metadata', always=True)
-    def ensure_metadata_dict(cls, v):
-        return v if v is not None else {}
+    def model_post_init(self, __context: Any) -> None:
+        """Derive word/character counts from the (stripped) content unless they were given"""
+        if 'word_count' not in self.model_fields_set:
+            self.__dict__['word_count'] = len(self.content.split())
+        if 'character_count' not in self.model_fields_set:
+            self.__dict__['character_count'] = len(self.content)
 
 
 # Processing Models
@@ -313,21 +311,21 @@ class ProcessingReport(BaseModel):
     warnings: List[str] = Field(default_factory=list)
     statistics: Dict[str, Any] = Field(default_factory=dict)
     
-    @validator('errors', always=True)
-    def ensure_errors_list(cls, v):
-        return v if v is not None else []
-    
-    @validator('warnings', always=True)
-    def ensure_warnings_list(cls, v):
-        return v if v is not None else []
+    # Monotonic clock readings behind processing_time (start/end_time are for display)
+    _start_ns: int = PrivateAttr(default_factory=time.perf_counter_ns)
+    _end_ns: Optional[int] = PrivateAttr(default=None)
     
-    @validator('statistics', always=True)
-    def ensure_statistics_dict(cls, v):
-        return v if v is not None else {}
+    def finish(self, status: ProcessingStatus = ProcessingStatus.COMPLETED) -> None:
+        """Record the end of the operation and set its final status"""
+        self._end_ns = time.perf_counter_ns()
+        self.end_time = datetime.now()
+        self.status = status
     
     @property
     def processing_time(self) -> Optional[float]:
         """Calculate processing time in seconds"""
+        if self._end_ns is not None:
+            return (self._end_ns - self._start_ns) / 1e9
         if self.end_time:
             return (self.end_time - self.start_time).total_seconds()
         return None
@@ -350,19 +348,16 @@ class QualityAssessment(BaseModel):
     issues: List[str] = Field(default_factory=list, description="Quality issues found")
     recommendations: List[str] = Field(default_factory=list, description="Improvement recommendations")
     assessment_date: datetime = Field(default_factory=datetime.now)
-    
-    @validator('issues', always=True)
-    def ensure_issues_list(cls, v):
-        return v if v is not None else []
-    
-    @validator('recommendations', always=True)
-    def ensure_recommendations_list(cls, v):
-        return v if v is not None else []
 
 
 # Search and Retrieval Models
+# Phase 2 models (search, RAG and config below) are not used by the Phase 1
+# pipeline, so they build their validators on first use instead of at import
+# (defer_build) and don't add to each worker's start-up time.
 class SearchQuery(BaseModel):
     """Search query model"""
+    model_config = ConfigDict(defer_build=True)
+    
     query: str = Field(..., description="Search query text")
     document_types: List[str] = Field(default_factory=list)
     date_range: Optional[Dict[str, str]] = Field(None, description="Date range filter")
@@ -370,27 +365,18 @@ class SearchQuery(BaseModel):
     keywords: List[str] = Field(default_factory=list)
     limit: int = Field(10, ge=1, le=100, description="Maximum results")
     
-    @validator('query')
+    @field_validator('query')
+    @classmethod
     def query_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v or v.isspace():
             raise ValueError('متن جستجو نمی‌تواند خالی باشد')
-        return v.strip()
-    
-    @validator('document_types', always=True)
-    def ensure_document_types_list(cls, v):
-        return v if v is not None else []
-    
-    @validator('authorities', always=True)
-    def ensure_authorities_list(cls, v):
-        return v if v is not None else []
-    
-    @validator('keywords', always=True)
-    def ensure_keywords_list(cls, v):
-        return v if v is not None else []
+        return _strip_if_needed(v)
 
 
 class SearchResult(BaseModel):
     """Search result model"""
+    model_config = ConfigDict(defer_build=True)
+    
     document_id: str = Field(..., description="Document ID")
     title: str = Field(..., description="Document title")
     score: float = Field(..., ge=0.0, le=1.0, description="Relevance score")
@@ -398,19 +384,13 @@ class SearchResult(BaseModel):
     highlights: List[str] = Field(default_factory=list, description="Highlighted terms")
     chunk_id: Optional[str] = Field(None, description="Source chunk ID")
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    
-    @validator('highlights', always=True)
-    def ensure_highlights_list(cls, v):
-        return v if v is not None else []
-    
-    @validator('metadata', always=True)
-    def ensure_metadata_dict(cls, v):
-        return v if v is not None else {}
 
 
 # Configuration Models
 class ProcessingConfig(BaseModel):
     """Configuration for document processing"""
+    model_config = ConfigDict(defer_build=True)
+    
     min_chunk_size: int = Field(200, ge=50, description="Minimum chunk size")
     max_chunk_size: int = Field(1000, ge=100, description="Maximum chunk size")
     chunk_overlap: int = Field(100, ge=0, description="Overlap between chunks")
@@ -418,16 +398,18 @@ class ProcessingConfig(BaseModel):
     max_keywords: int = Field(20, ge=1, description="Maximum keywords per item")
     quality_threshold: float = Field(0.4, ge=0.0, le=1.0, description="Minimum quality threshold")
     
-    @validator('chunk_overlap')
-    def overlap_less_than_max_size(cls, v, values):
-        if 'max_chunk_size' in values and v >= values['max_chunk_size']:
+    @model_validator(mode='after')
+    def overlap_less_than_max_size(self):
+        if self.chunk_overlap >= self.max_chunk_size:
             raise ValueError('Overlap باید کمتر از حداکثر اندازه chunk باشد')
-        return v
+        return self
 
 
 # Embedding and RAG Models
 class EmbeddingModel(BaseModel):
     """Embedding model configuration"""
+    model_config = ConfigDict(protected_namespaces=(), defer_build=True)
+    
     model_name: str = Field(..., description="Name of the embedding model")
     dimension: int = Field(..., description="Embedding dimension")
     max_sequence_length: int = Field(512, description="Maximum sequence length")
@@ -437,6 +419,8 @@ class EmbeddingModel(BaseModel):
 
 class VectorStoreConfig(BaseModel):
     """Vector store configuration"""
+    model_config = ConfigDict(defer_build=True)
+    
     store_type: str = Field("faiss", description="Type of vector store")
     index_path: str = Field(..., description="Path to store index")
     embedding_dim: int = Field(..., description="Embedding dimension")
@@ -446,6 +430,8 @@ class VectorStoreConfig(BaseModel):
 
 class RAGConfig(BaseModel):
     """RAG system configuration"""
+    model_config = ConfigDict(defer_build=True)
+    
     embedding_model: EmbeddingModel = Field(..., description="Embedding model config")
     vector_store: VectorStoreConfig = Field(..., description="Vector store config")
     retrieval_k: int = Field(5, ge=1, le=20, description="Number of documents to retrieve")
@@ -456,16 +442,11 @@ class RAGConfig(BaseModel):
 # Utility functions for model validation and creation
 def validate_persian_date(date_str: str) -> bool:
     """Validate Persian date format"""
-    if not date_str or date_str.strip() == "نامشخص":
+    if not date_str:
         return True
     
-    patterns = [
-        r'^\d{1,2}/\d{1,2}/\d{4}$',
-        r'^\d{1,2}/\d{1,2}/\d{2}$',
-        r'^[۰-۹]{1,2}/[۰-۹]{1,2}/[۰-۹]{4}$',
-        r'^[۰-۹]{1,2}/[۰-۹]{1,2}/[۰-۹]{2}$'
-    ]
-    return any(re.match(pattern, date_str.strip()) for pattern in patterns)
+    date_str = date_str.strip()
+    return date_str == "نامشخص" or _PERSIAN_DATE_RE.match(date_str) is not None
 
 
 def create_chunk_id(document_id: str, chunk_index: int) -> str:
@@ -476,47 +457,71 @@ def create_chunk_id(document_id: str, chunk_index: int) -> str:
 def create_document_id(title: str, approval_date: str) -> str:
     """Create standardized document ID"""
     # Clean title for ID creation
-    clean_title = re.sub(r'[^\w\s]', '', title)[:50]
-    clean_title = re.sub(r'\s+', '_', clean_title)
+    clean_title = _WHITESPACE_RE.sub('_', _NON_WORD_RE.sub('', title)[:50])
     
     # Clean date
-    clean_date = re.sub(r'[^\d]', '', approval_date) if approval_date != "نامشخص" else "unknown"
+    clean_date = _NON_DIGIT_RE.sub('', approval_date) if approval_date != "نامشخص" else "unknown"
     
     return f"doc_{clean_title}_{clean_date}"
 
 
+# Keyword rules, checked in order (Persian has no letter case, so no lowering).
+# Authority rule: (alternatives, value); an alternative matches when all of
+# its terms occur in the text.
+_AUTHORITY_RULES = (
+    ((('مجلس',), ('پارلمان',)), ApprovalAuthority.PARLIAMENT.value),
+    ((('هیئت',), ('هیات',), ('کابینه',)), ApprovalAuthority.CABINET.value),
+    ((('شورای', 'عالی'),), ApprovalAuthority.SUPREME_COUNCIL.value),
+    ((('وزارت',), ('وزیر',)), ApprovalAuthority.MINISTRY.value),
+)
+
+# Document type rule: (terms, value); matches when any term occurs in the title
+_DOCUMENT_TYPE_RULES = (
+    (('قانون',), DocumentType.LAW.value),
+    (('آیین‌نامه', 'آیین نامه'), DocumentType.REGULATION.value),
+    (('دستورالعمل',), DocumentType.INSTRUCTION.value),
+    (('مصوبه',), DocumentType.RESOLUTION.value),
+    (('بخشنامه',), DocumentType.CIRCULAR.value),
+)
+
+
+def _compile_term_scanner(terms) -> re.Pattern:
+    """Compile one pattern that reports every occurrence of any of the terms.
+
+    The alternation sits inside a lookahead so overlapping occurrences are
+    reported too, matching what independent ``in`` checks would find as long
+    as no term is a prefix of another.
+    """
+    unique_terms = sorted(set(terms), key=len, reverse=True)
+    return re.compile('(?=(' + '|'.join(map(re.escape, unique_terms)) + '))')
+
+
+_AUTHORITY_SCANNER = _compile_term_scanner(
+    term for alternatives, _ in _AUTHORITY_RULES for terms in alternatives for term in terms
+)
+_DOCUMENT_TYPE_SCANNER = _compile_term_scanner(
+    term for terms, _ in _DOCUMENT_TYPE_RULES for term in terms
+)
+
+
 def map_approval_authority(authority_text: str) -> str:
     """Map authority text to standardized value"""
-    authority_text = authority_text.lower().strip()
-    
-    if any(term in authority_text for term in ['مجلس', 'پارلمان']):
-        return ApprovalAuthority.PARLIAMENT.value
-    elif any(term in authority_text for term in ['هیئت', 'هیات', 'کابینه']):
-        return ApprovalAuthority.CABINET.value
-    elif 'شورای' in authority_text and 'عالی' in authority_text:
-        return ApprovalAuthority.SUPREME_COUNCIL.value
-    elif 'وزارت' in authority_text or 'وزیر' in authority_text:
-        return ApprovalAuthority.MINISTRY.value
-    else:
-        return ApprovalAuthority.UNKNOWN.value
+    found = set(_AUTHORITY_SCANNER.findall(authority_text))
+    if found:
+        for alternatives, value in _AUTHORITY_RULES:
+            if any(found.issuperset(terms) for terms in alternatives):
+                return value
+    return ApprovalAuthority.UNKNOWN.value
 
 
 def map_document_type(title: str) -> str:
     """Map document title to document type"""
-    title_lower = title.lower()
-    
-    if 'قانون' in title_lower:
-        return DocumentType.LAW.value
-    elif 'آیین‌نامه' in title_lower or 'آیین نامه' in title_lower:
-        return DocumentType.REGULATION.value
-    elif 'دستورالعمل' in title_lower:
-        return DocumentType.INSTRUCTION.value
-    elif 'مصوبه' in title_lower:
-        return DocumentType.RESOLUTION.value
-    elif 'بخشنامه' in title_lower:
-        return DocumentType.CIRCULAR.value
-    else:
-        return DocumentType.UNKNOWN.value
+    found = set(_DOCUMENT_TYPE_SCANNER.findall(title))
+    if found:
+        for terms, value in _DOCUMENT_TYPE_RULES:
+            if not found.isdisjoint(terms):
+                return value
+    return DocumentType.UNKNOWN.value
 
 
 # Export all models for easy imports
@@ -581,7 +586,7 @@ if __name__ == "__main__":
         print(f"   تعداد مواد: {doc.total_articles}")
         
         # Test JSON serialization
-        json_data = doc.json(ensure_ascii=False, indent=2)
+        json_data = doc.model_dump_json(indent=2)
         print("✓ سریالایزیشن JSON موفقیت‌آمیز بود")
         
         # Test utility functions
@@ -1 +1,74 @@
- 
+# ===============================================
+# src/data_processing/__init__.py
+# ===============================================
+"""
+Data processing modules for Legal Assistant
+Handles document splitting, parsing, text processing, and chunking
+
+Submodules are imported lazily on first attribute access (PEP 562).
+"""
+
+import importlib
+
+# Exported name -> (submodule, attribute in that submodule)
+_LAZY_IMPORTS = {
+    # Document Splitter
+    'DocumentSplitter': ('document_splitter', 'DocumentSplitter'),
+    'split_legal_document': ('document_splitter', 'split_legal_document'),
+    'LawMetadata': ('document_splitter', 'LawMetadata'),
+    
+    # Document Parser
+    'LegalDocumentParser': ('document_parser', 'LegalDocumentParser'),
+    'parse_legal_documents': ('document_parser', 'parse_legal_documents'),
+    'ParserSubsection': ('document_parser', 'LegalSubsection'),
+    'ParserNote': ('document_parser', 'LegalNote'),
+    'ParserArticle': ('document_parser', 'LegalArticle'),
+    'ParserChapter': ('document_parser', 'LegalChapter'),
+    'ParsedLegalDocument': ('document_parser', 'ParsedLegalDocument'),
+    
+    # Text Processor
+    'AdvancedTextProcessor': ('text_processor', 'AdvancedTextProcessor'),
+    'process_legal_documents': ('text_processor', 'process_legal_documents'),
+    
+    # Chunker
+    'IntelligentChunker': ('chunker', 'IntelligentChunker'),
+    'chunk_legal_documents': ('chunker', 'chunk_legal_documents'),
+    
+    # Metadata Generator
+    'MetadataGenerator': ('metadata_generator', 'MetadataGenerator'),
+    'generate_comprehensive_metadata': ('metadata_generator', 'generate_comprehensive_metadata'),
+}
+
+__all__ = [
+    # Document Splitter
+    'DocumentSplitter', 'split_legal_document', 'LawMetadata',
+    
+    # Document Parser
+    'LegalDocumentParser', 'parse_legal_documents',
+    'ParserSubsection', 'ParserNote', 'ParserArticle', 'ParserChapter',
+    'ParsedLegalDocument',
+    
+    # Text Processor
+    'AdvancedTextProcessor', 'process_legal_documents',
+    
+    # Chunker
+    'IntelligentChunker', 'chunk_legal_documents',
+    
+    # Metadata Generator
+    'MetadataGenerator', 'generate_comprehensive_metadata'
+]
+
+
+def __getattr__(name):
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module_name, attr = target
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
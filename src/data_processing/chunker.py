@@ -4,7 +4,12 @@ Intelligent text chunker for Legal Assistant
 Creates optimal chunks for RAG while preserving legal document structure
 """
 
+import bisect
+import itertools
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 import json
@@ -12,12 +17,31 @@ from pathlib import Path
 
 from ..core.config import DOCUMENT_CONFIG
 from ..core.models import (
-    LegalDocument, TextChunk, ProcessingReport, ProcessingStatus,
+    LegalDocument, TextChunk, ProcessingReport, ProcessingStatus, ChunkType,
     LegalArticle, LegalChapter, LegalNote, LegalSubsection,
     create_chunk_id
 )
 from ..utils.text_utils import PersianTextProcessor
 
+# A word as str.split() sees it: a run of non-whitespace characters
+_WORD_RE = re.compile(r'\S+')
+
+# Documents per block of progress lines printed by chunk_documents_batch
+_PROGRESS_BLOCK_SIZE = 100
+
+# Entries kept in a chunker's size_fn memo before it is cleared
+_SIZE_CACHE_LIMIT = 4096
+
+# Zero-padded chunk counters, so chunk ids are built by concatenation
+_PADDED_COUNTERS = tuple(f"{i:03d}" for i in range(1024))
+
+
+def _padded_counter(counter: int) -> str:
+    """Format a chunk counter as in f"{counter:03d}", from the table when possible"""
+    if counter < len(_PADDED_COUNTERS):
+        return _PADDED_COUNTERS[counter]
+    return f"{counter:03d}"
+
 
 class IntelligentChunker:
     """
@@ -33,6 +57,15 @@ class IntelligentChunker:
         self.max_chunk_size = self.config.get('max_chunk_size', 1000)
         self.chunk_overlap = self.config.get('chunk_overlap', 100)
         
+        # Sizer for chunk budgets: characters by default, or e.g. a tokenizer's
+        # token count. Non-len sizers are memoized in _size_cache, since the
+        # same sentences and words are measured again while packing chunks.
+        # Batches with max_workers != 1 pickle the config, so size_fn must
+        # then be picklable (e.g. a module-level function).
+        self.size_fn = self.config.get('size_fn', len)
+        self._size_cache: Dict[str, int] = {}
+        self._measure = self.size_fn if self.size_fn is len else self._cached_size
+        
         # Processing statistics
         self.chunking_stats = {
             'documents_chunked': 0,
@@ -44,6 +77,26 @@ class IntelligentChunker:
             'oversized_chunks': 0,
             'undersized_chunks': 0
         }
+        
+        # Creation time shared by every chunk of the document being chunked
+        self._creation_time: Optional[str] = None
+    
+    def _cached_size(self, text: str) -> int:
+        """
+        Measure text with size_fn, reusing the memoized size when available
+        
+        Args:
+            text (str): Text to measure
+            
+        Returns:
+            int: Size of the text
+        """
+        size = self._size_cache.get(text)
+        if size is None:
+            if len(self._size_cache) >= _SIZE_CACHE_LIMIT:
+                self._size_cache.clear()
+            size = self._size_cache[text] = self.size_fn(text)
+        return size
     
     def calculate_chunk_priority(self, content_type: str, position: int) -> int:
         """
@@ -82,7 +135,7 @@ class IntelligentChunker:
         Returns:
             bool: True if content should be split
         """
-        return len(content) > self.max_chunk_size
+        return self._measure(content) > self.max_chunk_size
     
     def can_combine_contents(self, content1: str, content2: str) -> bool:
         """
@@ -95,7 +148,7 @@ class IntelligentChunker:
         Returns:
             bool: True if contents can be combined
         """
-        combined_length = len(content1) + len(content2) + self.chunk_overlap
+        combined_length = self._measure(content1) + self._measure(content2) + self.chunk_overlap
         return combined_length <= self.max_chunk_size
     
     def split_long_content(self, content: str, content_type: str) -> List[str]:
@@ -106,43 +159,45 @@ class IntelligentChunker:
             content (str): Content to split
             content_type (str): Type of content
             
+        Sentences are packed by size_fn; a sentence that is too long on its
+        own falls back to split_by_words, which packs its words the same way.
+        
         Returns:
             List[str]: List of content chunks
         """
-        if len(content) <= self.max_chunk_size:
+        if not self.should_split_content(content):
             return [content]
         
         chunks = []
-        
-        # Try to split by sentences first
-        sentences = self.text_processor.split_sentences(content)
-        
-        if len(sentences) > 1:
-            current_chunk = ""
+        max_size = self.max_chunk_size
+        
+        # Try to split by sentences first, packing whole sentences into
+        # slices of the original content
+        spans = self.text_processor.sentence_spans(content)
+        
+        if len(spans) > 1:
+            # Sentences i..j fit in one chunk when bounds[j] - starts[i] is
+            # within budget; for len these are just the character offsets
+            if self.size_fn is len:
+                starts = [start for start, _ in spans]
+                bounds = [end for _, end in spans]
+            else:
+                bounds = list(itertools.accumulate(self._measure(content[start:end]) for start, end in spans))
+                starts = [0] + bounds[:-1]
+            i = 0
             
-            for sentence in sentences:
-                # Check if adding this sentence would exceed max size
-                potential_chunk = current_chunk + " " + sentence if current_chunk else sentence
+            while i < len(spans):
+                if bounds[i] - starts[i] > max_size:
+                    # If single sentence is too long, split by words
+                    start, end = spans[i]
+                    chunks.extend(self.split_by_words(content[start:end]))
+                    i += 1
+                    continue
                 
-                if len(potential_chunk) <= self.max_chunk_size:
-                    current_chunk = potential_chunk
-                else:
-                    # Save current chunk if it's not empty
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    
-                    # Start new chunk with current sentence
-                    if len(sentence) <= self.max_chunk_size:
-                        current_chunk = sentence
-                    else:
-                        # If single sentence is too long, split by words
-                        word_chunks = self.split_by_words(sentence)
-                        chunks.extend(word_chunks[:-1])
-                        current_chunk = word_chunks[-1] if word_chunks else ""
-            
-            # Add remaining chunk
-            if current_chunk:
-                chunks.append(current_chunk.strip())
+                # Last sentence that still fits in a chunk starting here
+                j = bisect.bisect_right(bounds, starts[i] + max_size, i) - 1
+                chunks.append(content[spans[i][0]:spans[j][1]])
+                i = j + 1
         
         else:
             # Single sentence/paragraph - split by words
@@ -161,31 +216,41 @@ class IntelligentChunker:
             content (str): Content to split
             
         Returns:
-            List[str]: List of word-based chunks
+            List[str]: List of word-based chunks (slices of content, so
+                whitespace between words is kept as written)
         """
-        words = content.split()
         chunks = []
-        current_chunk_words = []
-        current_length = 0
-        
-        for word in words:
-            word_length = len(word) + 1  # +1 for space
+        chunk_start = chunk_end = None
+        chunk_size = 0
+        max_size = self.max_chunk_size
+        by_chars = self.size_fn is len
+        
+        for match in _WORD_RE.finditer(content):
+            start, end = match.span()
+            # Other sizers add up the (memoized) size of each word
+            word_size = 0 if by_chars else self._measure(match.group())
             
-            if current_length + word_length <= self.max_chunk_size:
-                current_chunk_words.append(word)
-                current_length += word_length
-            else:
-                # Save current chunk
-                if current_chunk_words:
-                    chunks.append(' '.join(current_chunk_words))
+            if chunk_start is not None:
+                if by_chars:
+                    # Same budget as counting each word plus one separator
+                    fits = end - chunk_start < max_size
+                else:
+                    fits = chunk_size + word_size <= max_size
                 
-                # Start new chunk
-                current_chunk_words = [word]
-                current_length = word_length
+                if fits:
+                    chunk_end = end
+                    chunk_size += word_size
+                    continue
+                
+                # Save current chunk
+                chunks.append(content[chunk_start:chunk_end])
+            
+            # Start new chunk
+            chunk_start, chunk_end, chunk_size = start, end, word_size
         
         # Add remaining words
-        if current_chunk_words:
-            chunks.append(' '.join(current_chunk_words))
+        if chunk_start is not None:
+            chunks.append(content[chunk_start:chunk_end])
         
         return chunks
     
@@ -203,6 +268,10 @@ class IntelligentChunker:
             return chunks
         
         overlapped_chunks = []
+        overlap_word_count = self.chunk_overlap//10  # Rough word estimate
+        max_size = self.max_chunk_size
+        measure = self._measure
+        separator_size = measure(" ")
         
         for i, chunk in enumerate(chunks):
             if i == 0:
@@ -212,12 +281,18 @@ class IntelligentChunker:
                 # Get overlap from previous chunk
                 prev_chunk = chunks[i-1]
                 
-                # Extract last portion of previous chunk for overlap
-                overlap_words = prev_chunk.split()[-self.chunk_overlap//10:]  # Rough word estimate
+                # Extract last portion of previous chunk for overlap; rsplit
+                # stops after the words needed instead of splitting it all
+                if self.size_fn is not len:
+                    overlap_words = self._trailing_words(prev_chunk, self.chunk_overlap)
+                elif overlap_word_count:
+                    overlap_words = prev_chunk.rsplit(None, overlap_word_count)[-overlap_word_count:]
+                else:
+                    overlap_words = prev_chunk.split()
                 overlap_text = ' '.join(overlap_words)
                 
                 # Combine with current chunk
-                if len(overlap_text) + len(chunk) <= self.max_chunk_size:
+                if overlap_text and measure(overlap_text) + separator_size + measure(chunk) <= max_size:
                     combined_chunk = overlap_text + " " + chunk
                     overlapped_chunks.append(combined_chunk)
                 else:
@@ -226,6 +301,29 @@ class IntelligentChunker:
         
         return overlapped_chunks
     
+    def _trailing_words(self, content: str, budget: int) -> List[str]:
+        """
+        Get the last words of content whose total size_fn size fits the budget
+        
+        Args:
+            content (str): Content to take the words from
+            budget (int): Maximum total size of the words
+            
+        Returns:
+            List[str]: Trailing words in their original order
+        """
+        words = []
+        total = 0
+        
+        for word in reversed(content.split()):
+            total += self._measure(word)
+            if total > budget:
+                break
+            words.append(word)
+        
+        words.reverse()
+        return words
+    
     def create_chunk_metadata(self, source_element: str, element_type: str, 
                             document_id: str, position: int) -> Dict:
         """
@@ -246,9 +344,49 @@ class IntelligentChunker:
             'document_id': document_id,
             'position': position,
             'priority': self.calculate_chunk_priority(element_type, position),
-            'creation_time': datetime.now().isoformat()
+            'creation_time': self._creation_time or datetime.now().isoformat()
         }
     
+    def _iter_article_parts(self, article: LegalArticle):
+        """
+        Yield the chunkable parts of an article in chunk order
+        
+        Args:
+            article (LegalArticle): Article to walk
+            
+        Yields:
+            Tuple: (element type, chunk type, content, keywords, legal references,
+                    source element identifier) for the article body, each
+                    subsection and each note that has content
+        """
+        # Main article content, with the title in the first chunk if present
+        if article.content:
+            if article.title:
+                main_content = f"{article.number} - {article.title}\n\n{article.content}"
+            else:
+                main_content = f"{article.number}\n\n{article.content}"
+            
+            yield ('article', ChunkType.ARTICLE, main_content, article.keywords[:10],
+                   [article.number], article.number)
+        
+        # Article subsections
+        for j, subsection in enumerate(article.subsections):
+            if subsection.content:
+                yield ('subsection', ChunkType.SUBSECTION,
+                       f"{article.number} - {subsection.type} {subsection.number}\n\n{subsection.content}",
+                       subsection.keywords[:5],
+                       [article.number, f"بند {subsection.number}"],
+                       f"{article.number}_subsection_{j}")
+        
+        # Article notes
+        for k, note in enumerate(article.notes):
+            if note.content:
+                yield ('note', ChunkType.NOTE,
+                       f"{article.number} - {note.number}\n\n{note.content}",
+                       note.keywords[:5],
+                       [article.number, note.number],
+                       f"{article.number}_note_{k}")
+    
     def chunk_article(self, article: LegalArticle, document_id: str, 
                      position: int, base_chunk_id: str) -> List[TextChunk]:
         """
@@ -265,110 +403,36 @@ class IntelligentChunker:
         """
         chunks = []
         chunk_counter = 0
-        
-        # Main article content
-        if article.content:
-            content_chunks = []
-            
-            # Include article title in first chunk if present
-            if article.title:
-                main_content = f"{article.number} - {article.title}\n\n{article.content}"
+        id_prefix = f"{base_chunk_id}_"
+        measure, max_size = self._measure, self.max_chunk_size
+        
+        # Chunks split from the same part share its keyword and reference
+        # lists; TextChunk is frozen and nothing mutates these lists
+        for element_type, chunk_type, part_content, keywords, references, source in self._iter_article_parts(article):
+            if measure(part_content) <= max_size:
+                # Common case: the part fits in one chunk, skip the splitter
+                content_chunks = (part_content,)
             else:
-                main_content = f"{article.number}\n\n{article.content}"
-            
-            if self.should_split_content(main_content):
-                content_chunks = self.split_long_content(main_content, 'article')
-            else:
-                content_chunks = [main_content]
+                content_chunks = self.split_long_content(part_content, element_type)
             
-            # Create chunks for main content
-            for i, content in enumerate(content_chunks):
-                chunk_id = f"{base_chunk_id}_{chunk_counter:03d}"
-                
-                chunk = TextChunk(
-                    id=chunk_id,
+            for content in content_chunks:
+                chunk = TextChunk.fast_build(
+                    id=id_prefix + _padded_counter(chunk_counter),
                     document_id=document_id,
-                    content=content,
-                    chunk_type='article',
+                    content=content.strip(),
+                    chunk_type=chunk_type,
                     position=position,
-                    word_count=len(content.split()),
-                    character_count=len(content),
-                    keywords=article.keywords[:10],  # Take top keywords
-                    legal_references=[article.number],
+                    keywords=keywords,
+                    legal_references=references,
                     metadata=self.create_chunk_metadata(
-                        article.number, 'article', document_id, position
+                        source, element_type, document_id, position
                     )
                 )
                 
                 chunks.append(chunk)
                 chunk_counter += 1
-                self.chunking_stats['article_chunks'] += 1
-        
-        # Article subsections
-        for j, subsection in enumerate(article.subsections):
-            if subsection.content:
-                subsection_content = f"{article.number} - {subsection.type} {subsection.number}\n\n{subsection.content}"
-                
-                if self.should_split_content(subsection_content):
-                    subsection_chunks = self.split_long_content(subsection_content, 'subsection')
-                else:
-                    subsection_chunks = [subsection_content]
-                
-                for content in subsection_chunks:
-                    chunk_id = f"{base_chunk_id}_{chunk_counter:03d}"
-                    
-                    chunk = TextChunk(
-                        id=chunk_id,
-                        document_id=document_id,
-                        content=content,
-                        chunk_type='subsection',
-                        position=position,
-                        word_count=len(content.split()),
-                        character_count=len(content),
-                        keywords=subsection.keywords[:5],
-                        legal_references=[article.number, f"بند {subsection.number}"],
-                        metadata=self.create_chunk_metadata(
-                            f"{article.number}_subsection_{j}", 'subsection', 
-                            document_id, position
-                        )
-                    )
-                    
-                    chunks.append(chunk)
-                    chunk_counter += 1
-                    self.chunking_stats['subsection_chunks'] += 1
-        
-        # Article notes
-        for k, note in enumerate(article.notes):
-            if note.content:
-                note_content = f"{article.number} - {note.number}\n\n{note.content}"
-                
-                if self.should_split_content(note_content):
-                    note_chunks = self.split_long_content(note_content, 'note')
-                else:
-                    note_chunks = [note_content]
-                
-                for content in note_chunks:
-                    chunk_id = f"{base_chunk_id}_{chunk_counter:03d}"
-                    
-                    chunk = TextChunk(
-                        id=chunk_id,
-                        document_id=document_id,
-                        content=content,
-                        chunk_type='note',
-                        position=position,
-                        word_count=len(content.split()),
-                        character_count=len(content),
-                        keywords=note.keywords[:5],
-                        legal_references=[article.number, note.number],
-                        metadata=self.create_chunk_metadata(
-                            f"{article.number}_note_{k}", 'note', 
-                            document_id, position
-                        )
-                    )
-                    
-                    chunks.append(chunk)
-                    chunk_counter += 1
-                    self.chunking_stats['note_chunks'] += 1
+            
+            self.chunking_stats[f'{element_type}_chunks'] += len(content_chunks)
         
         return chunks
     
@@ -388,20 +452,19 @@ class IntelligentChunker:
         """
         chunks = []
         chunk_counter = 0
+        id_prefix = f"{base_chunk_id}_"
         
         # Chapter title chunk
         if chapter.title:
             chapter_content = f"{chapter.number} - {chapter.title}"
-            chunk_id = f"{base_chunk_id}_{chunk_counter:03d}"
+            chunk_id = id_prefix + _padded_counter(chunk_counter)
             
-            chunk = TextChunk(
+            chunk = TextChunk.fast_build(
                 id=chunk_id,
                 document_id=document_id,
-                content=chapter_content,
-                chunk_type='chapter_title',
+                content=chapter_content.strip(),
+                chunk_type=ChunkType.CHAPTER_TITLE,
                 position=position,
-                word_count=len(chapter_content.split()),
-                character_count=len(chapter_content),
                 keywords=self.text_processor.extract_keywords(chapter_content, max_keywords=5),
                 legal_references=[chapter.number],
                 metadata=self.create_chunk_metadata(
@@ -435,6 +498,7 @@ class IntelligentChunker:
         """
         chunks = []
         position_counter = 0
+        self._creation_time = datetime.now().isoformat()
         
         try:
             # Process chapters
@@ -457,22 +521,21 @@ class IntelligentChunker:
             
             # Process footnotes
             if document.footnotes:
+                # A list (not a generator) is what str.join consumes fastest
                 footnotes_content = "\n\n".join([
-                    f"پاورقی {i+1}: {footnote}" 
-                    for i, footnote in enumerate(document.footnotes)
+                    f"پاورقی {i}: {footnote}"
+                    for i, footnote in enumerate(document.footnotes, 1)
                 ])
                 
                 if footnotes_content:
                     chunk_id = f"{document.id}_footnotes"
                     
-                    chunk = TextChunk(
+                    chunk = TextChunk.fast_build(
                         id=chunk_id,
                         document_id=document.id,
-                        content=footnotes_content,
-                        chunk_type='footnote',
+                        content=footnotes_content.strip(),
+                        chunk_type=ChunkType.FOOTNOTE,
                         position=position_counter,
-                        word_count=len(footnotes_content.split()),
-                        character_count=len(footnotes_content),
                         keywords=self.text_processor.extract_keywords(footnotes_content, max_keywords=5),
                         legal_references=["پاورقی"],
                         metadata=self.create_chunk_metadata(
@@ -486,29 +549,39 @@ class IntelligentChunker:
             self.chunking_stats['total_chunks_created'] += len(chunks)
             
             # Update chunk quality statistics
+            max_size, min_size = self.max_chunk_size, self.min_chunk_size
+            oversized = undersized = 0
             for chunk in chunks:
-                if chunk.character_count > self.max_chunk_size:
-                    self.chunking_stats['oversized_chunks'] += 1
-                elif chunk.character_count < self.min_chunk_size:
-                    self.chunking_stats['undersized_chunks'] += 1
+                # Limits are in size_fn units
+                chunk_size = self._measure(chunk.content)
+                if chunk_size > max_size:
+                    oversized += 1
+                elif chunk_size < min_size:
+                    undersized += 1
+            self.chunking_stats['oversized_chunks'] += oversized
+            self.chunking_stats['undersized_chunks'] += undersized
             
             return chunks
         
         except Exception as e:
             raise Exception(f"خطا در تقسیم سند {document.id}: {str(e)}")
+        
+        finally:
+            self._creation_time = None
     
-    def chunk_documents_batch(self, documents: List[LegalDocument]) -> Tuple[List[TextChunk], ProcessingReport]:
+    def chunk_documents_batch(self, documents: List[LegalDocument],
+                              max_workers: Optional[int] = 1) -> Tuple[List[TextChunk], ProcessingReport]:
         """
         Chunk multiple documents in batch
         
         Args:
             documents (List[LegalDocument]): Documents to chunk
+            max_workers (Optional[int]): Worker processes to chunk with; 1 (default)
+                chunks in this process and None uses all CPUs
             
         Returns:
             Tuple[List[TextChunk], ProcessingReport]: All chunks and processing report
         """
-        start_time = datetime.now()
-        
         report = ProcessingReport(
             operation_type="text_chunking",
             total_items=len(documents),
@@ -517,25 +590,68 @@ class IntelligentChunker:
         
         all_chunks = []
         
-        for i, document in enumerate(documents):
+        workers = min(max_workers or os.cpu_count() or 1, len(documents))
+        executor = None
+        
+        if workers > 1 and self.size_fn is not len:
+            # Workers receive the config, size_fn included, by pickling
             try:
-                document_chunks = self.chunk_document(document)
-                all_chunks.extend(document_chunks)
-                report.processed_items += 1
+                pickle.dumps(self.size_fn)
+            except Exception as e:
+                raise ValueError(
+                    f"size_fn باید قابل pickle باشد (مثلاً تابعی در سطح ماژول) تا با max_workers={max_workers} اجرا شود: {e}"
+                ) from e
+        
+        if workers > 1:
+            # Each worker builds its own chunker; only documents and chunks cross processes
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker_chunker,
+                initargs=(self.config,)
+            )
+            chunksize = max(1, len(documents) // (workers * 4))
+            results = executor.map(_chunk_in_worker, documents, chunksize=chunksize)
+        else:
+            results = (_chunk_with_stats(self, document) for document in documents)
+        
+        # Progress lines are printed in blocks rather than one write per document
+        progress = []
+        
+        try:
+            for i, (document, (document_chunks, error, stats)) in enumerate(zip(documents, results)):
+                if error is None:
+                    if executor is not None:
+                        # Worker stats were counted on the worker's chunker
+                        for key, value in stats.items():
+                            self.chunking_stats[key] += value
+                    
+                    all_chunks.extend(document_chunks)
+                    report.processed_items += 1
+                    
+                    progress.append(f"✓ تقسیم شد ({i+1}/{len(documents)}): {document.title[:50]}... - {len(document_chunks)} chunk")
                 
-                print(f"✓ تقسیم شد ({i+1}/{len(documents)}): {document.title[:50]}... - {len(document_chunks)} chunk")
+                else:
+                    error_msg = f"خطا در تقسیم سند {document.id}: {error}"
+                    report.errors.append(error_msg)
+                    report.failed_items += 1
+                    progress.append(f"✗ خطا ({i+1}/{len(documents)}): {error_msg}")
                 
-            except Exception as e:
-                error_msg = f"خطا در تقسیم سند {document.id}: {str(e)}"
-                report.errors.append(error_msg)
-                report.failed_items += 1
-                print(f"✗ خطا ({i+1}/{len(documents)}): {error_msg}")
+                if len(progress) >= _PROGRESS_BLOCK_SIZE:
+                    print("\n".join(progress))
+                    progress.clear()
+        finally:
+            if progress:
+                print("\n".join(progress))
+            if executor is not None:
+                executor.shutdown()
         
         # Finalize report
-        report.end_time = datetime.now()
-        report.status = ProcessingStatus.COMPLETED
+        report.finish()
         report.statistics = self.chunking_stats.copy()
         
+        # Cached text results are only useful within one batch
+        self.text_processor.clear_caches()
+        
         return all_chunks, report
     
     def get_chunking_statistics(self) -> Dict:
@@ -565,28 +681,70 @@ class IntelligentChunker:
             chunks (List[TextChunk]): Chunks to export
             output_file (str): Output file path
         """
-        chunks_data = {
-            'metadata': {
-                'total_chunks': len(chunks),
-                'creation_date': datetime.now().isoformat(),
-                'chunking_config': {
-                    'min_size': self.min_chunk_size,
-                    'max_size': self.max_chunk_size,
-                    'overlap': self.chunk_overlap
-                }
-            },
-            'chunks': [chunk.dict() for chunk in chunks]
+        metadata = {
+            'total_chunks': len(chunks),
+            'creation_date': datetime.now().isoformat(),
+            'chunking_config': {
+                'min_size': self.min_chunk_size,
+                'max_size': self.max_chunk_size,
+                'overlap': self.chunk_overlap
+            }
         }
         
         output_path = Path(output_file)
         output_path.parent.mkdir(exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(chunks_data, f, ensure_ascii=False, indent=2)
+        # Serialize chunk by chunk so the whole export is never held as dicts;
+        # the 1 MiB buffer turns the many small writes into few large ones
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write('{"metadata": ')
+            f.write(json.dumps(metadata, ensure_ascii=False))
+            f.write(', "chunks": [')
+            
+            for i, chunk in enumerate(chunks):
+                if i:
+                    f.write(', ')
+                f.write(chunk.model_dump_json())
+            
+            f.write(']}')
         
         print(f"✓ {len(chunks)} chunk در فایل ذخیره شد: {output_path}")
 
 
+# Chunker owned by a chunk_documents_batch worker process
+_worker_chunker: Optional[IntelligentChunker] = None
+
+
+def _init_worker_chunker(config: Dict) -> None:
+    """Create the chunker used by this worker process"""
+    global _worker_chunker
+    _worker_chunker = IntelligentChunker(config)
+
+
+def _chunk_with_stats(chunker: IntelligentChunker, document: LegalDocument) -> Tuple[Optional[List[TextChunk]], Optional[str], Dict]:
+    """
+    Chunk one document, catching its error
+    
+    Returns:
+        Tuple: (chunks or None, error message or None, chunking stats delta)
+    """
+    stats_before = chunker.chunking_stats.copy()
+    
+    try:
+        chunks = chunker.chunk_document(document)
+    except Exception as e:
+        return None, str(e), {}
+    
+    return chunks, None, {
+        key: value - stats_before[key] for key, value in chunker.chunking_stats.items()
+    }
+
+
+def _chunk_in_worker(document: LegalDocument) -> Tuple[Optional[List[TextChunk]], Optional[str], Dict]:
+    """Chunk one document with the worker process's chunker"""
+    return _chunk_with_stats(_worker_chunker, document)
+
+
 def chunk_legal_documents(documents: List[LegalDocument], config: Optional[Dict] = None) -> Tuple[List[TextChunk], ProcessingReport]:
     """
     Convenience function to chunk legal documents
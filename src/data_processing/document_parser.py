@@ -4,18 +4,89 @@ Document parser for Legal Assistant
 Analyzes and parses the internal structure of individual legal documents
 """
 
+import os
 import re
 import json
+import heapq
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
 from pathlib import Path
 
-from ..core.config import DOCUMENT_CONFIG
+from ..core import models
+from ..core.config import DOCUMENT_CONFIG, COMPILED_PATTERNS
 from ..utils.text_utils import PersianTextProcessor
 
 
-@dataclass
+# Header patterns without re.MULTILINE: these strip a header only at the very
+# start of an article or note, unlike the MULTILINE COMPILED_PATTERNS scans
+_ARTICLE_HEADER_RE = re.compile(DOCUMENT_CONFIG["article_pattern"])
+_SINGLE_ARTICLE_HEADER_RE = re.compile(DOCUMENT_CONFIG["single_article_pattern"])
+_NOTE_HEADER_RE = re.compile(DOCUMENT_CONFIG["note_pattern"])
+
+# Subsection header patterns by type, in the order extract_subsections tries
+# them. A subsection's body runs from the end of its header to the next header
+# of the same type, so only headers are matched and bodies are sliced.
+_SUBSECTION_HEADERS = tuple(
+    (re.compile(pattern, re.MULTILINE), subsection_type)
+    for pattern, subsection_type in (
+        (r'^([۰-۹]+)\s*[-–—]\s*', 'numbered'),
+        (r'^([الف-ی]+)\s*[-–—]\s*', 'lettered'),
+        (r'^[-–—]\s*', 'dash'),
+    )
+)
+
+# Footnote marker, and the (unanchored) reference that ends a footnote's text
+_FOOTNOTE_MARKER_RE = re.compile(DOCUMENT_CONFIG["footnote_pattern"])
+_FOOTNOTE_END_RE = re.compile(r'\(\d+\)')
+
+# Title keyword -> document type, in priority order: the first keyword found
+# in a title wins, wherever it appears (e.g. an آیین‌نامه of a قانون is a قانون)
+_DOCUMENT_TYPE_KEYWORDS = (
+    ('قانون', 'قانون'),
+    ('آیین‌نامه', 'آیین‌نامه'),
+    ('آیین نامه', 'آیین‌نامه'),
+    ('دستورالعمل', 'دستورالعمل'),
+    ('مصوبه', 'مصوبه'),
+    ('بخشنامه', 'بخشنامه'),
+)
+
+
+def _with_next_start(matches, end: int):
+    """
+    Pair each match with the start of the next one
+    
+    Args:
+        matches: Iterator of matches in text order
+        end (int): Position paired with the last match
+        
+    Yields:
+        Tuple: (match, start of the following match or end)
+    """
+    previous = next(matches, None)
+    if previous is None:
+        return
+    
+    for match in matches:
+        yield previous, match.start()
+        previous = match
+    
+    yield previous, end
+
+
+def _dataclass_fields(obj):
+    """JSON default hook: expose a dataclass's fields without deep-copying them"""
+    if is_dataclass(obj):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Serializes parsed documents (nested dataclasses) in the same shape as asdict()
+_DOCUMENT_ENCODER = json.JSONEncoder(ensure_ascii=False, default=_dataclass_fields)
+
+@dataclass(slots=True)
 class LegalSubsection:
     """Represents a subsection within an article"""
     number: str
@@ -28,7 +99,7 @@ class LegalSubsection:
             self.keywords = []
 
 
-@dataclass
+@dataclass(slots=True)
 class LegalNote:
     """Represents a note (تبصره) within an article"""
     number: str
@@ -43,7 +114,7 @@ class LegalNote:
             self.keywords = []
 
 
-@dataclass
+@dataclass(slots=True)
 class LegalArticle:
     """Represents a legal article (ماده)"""
     number: str
@@ -65,7 +136,7 @@ class LegalArticle:
             self.word_count = len(self.content.split()) if self.content else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class LegalChapter:
     """Represents a chapter (فصل) in a legal document"""
     number: str
@@ -88,7 +159,7 @@ class LegalChapter:
         return sum(article.word_count or 0 for article in self.articles)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedLegalDocument:
     """Complete parsed legal document structure"""
     id: str
@@ -142,6 +213,8 @@ class LegalDocumentParser:
             'notes_extracted': 0,
             'parsing_errors': 0
         }
+        # Shared parsing timestamp while a batch runs
+        self._parsing_timestamp: Optional[str] = None
     
     def identify_document_type(self, title: str) -> str:
         """
@@ -153,20 +226,12 @@ class LegalDocumentParser:
         Returns:
             str: Document type
         """
-        title_lower = title.lower()
-        
-        if 'قانون' in title_lower:
-            return 'قانون'
-        elif 'آیین‌نامه' in title_lower or 'آیین نامه' in title_lower:
-            return 'آیین‌نامه'
-        elif 'دستورالعمل' in title_lower:
-            return 'دستورالعمل'
-        elif 'مصوبه' in title_lower:
-            return 'مصوبه'
-        elif 'بخشنامه' in title_lower:
-            return 'بخشنامه'
-        else:
-            return 'نامشخص'
+        # Keywords are Persian, so the title needs no case folding
+        for keyword, document_type in _DOCUMENT_TYPE_KEYWORDS:
+            if keyword in title:
+                return document_type
+        
+        return 'نامشخص'
     
     def extract_chapters(self, text: str) -> List[Tuple[str, str, int, int]]:
         """
@@ -179,69 +244,56 @@ class LegalDocumentParser:
             List[Tuple]: List of (chapter_num, chapter_title, start_pos, end_pos)
         """
         chapters = []
-        chapter_pattern = DOCUMENT_CONFIG["chapter_pattern"]
+        chapter_pattern = COMPILED_PATTERNS["chapter_pattern"]
         
-        # Find all chapter headers
-        chapter_matches = list(re.finditer(chapter_pattern, text, re.MULTILINE))
-        
-        for i, match in enumerate(chapter_matches):
+        # Each chapter ends where the next one starts, the last at end of text
+        for match, end_pos in _with_next_start(chapter_pattern.finditer(text), len(text)):
             chapter_num = match.group(1).strip()
             chapter_title = match.group(2).strip() if match.group(2) else ""
-            start_pos = match.start()
-            
-            # Determine end position (start of next chapter or end of text)
-            if i + 1 < len(chapter_matches):
-                end_pos = chapter_matches[i + 1].start()
-            else:
-                end_pos = len(text)
             
-            chapters.append((chapter_num, chapter_title, start_pos, end_pos))
+            chapters.append((chapter_num, chapter_title, match.start(), end_pos))
         
         return chapters
     
-    def extract_articles(self, text: str) -> List[Tuple[str, str, int, int]]:
+    def extract_articles(self, text: str, start: int = 0, end: Optional[int] = None) -> List[Tuple[str, str, int, int]]:
         """
         Extract articles from text
         
         Args:
             text (str): Text to extract articles from
+            start (int): Offset where the range to scan starts
+            end (Optional[int]): Offset where the range to scan ends (end of text if None)
             
         Returns:
-            List[Tuple]: List of (article_num, article_title, start_pos, end_pos)
+            List[Tuple]: List of (article_num, article_title, start_pos, end_pos),
+                with offsets into text
         """
         articles = []
+        if end is None:
+            end = len(text)
         
         # Patterns for different article types
-        article_pattern = DOCUMENT_CONFIG["article_pattern"]
-        single_article_pattern = DOCUMENT_CONFIG["single_article_pattern"]
-        
-        # Find regular articles
-        article_matches = list(re.finditer(article_pattern, text, re.MULTILINE))
-        
-        # Find single articles (ماده واحده)
-        single_matches = list(re.finditer(single_article_pattern, text, re.MULTILINE))
-        
-        # Combine and sort all matches
-        all_matches = [(m, 'regular') for m in article_matches] + [(m, 'single') for m in single_matches]
-        all_matches.sort(key=lambda x: x[0].start())
+        article_pattern = COMPILED_PATTERNS["article_pattern"]
+        single_article_pattern = COMPILED_PATTERNS["single_article_pattern"]
+        
+        # Merge regular and single (ماده واحده) articles in text order; at
+        # the same position the regular match comes first
+        all_matches = heapq.merge(
+            article_pattern.finditer(text, start, end),
+            single_article_pattern.finditer(text, start, end),
+            key=lambda match: match.start()
+        )
         
-        for i, (match, article_type) in enumerate(all_matches):
-            if article_type == 'single':
+        # Each article ends where the next one of either type starts
+        for match, end_pos in _with_next_start(all_matches, end):
+            if match.re is single_article_pattern:
                 article_num = match.group(1).strip()
                 article_title = ""
             else:
                 article_num = match.group(1).strip()
                 article_title = match.group(2).strip() if match.group(2) else ""
             
-            start_pos = match.start()
-            
-            # Determine end position
-            if i + 1 < len(all_matches):
-                end_pos = all_matches[i + 1][0].start()
-            else:
-                end_pos = len(text)
-            
-            articles.append((article_num, article_title, start_pos, end_pos))
+            articles.append((article_num, article_title, match.start(), end_pos))
         
         return articles
     
@@ -256,38 +308,42 @@ class LegalDocumentParser:
             List[LegalSubsection]: List of subsections
         """
         subsections = []
+        text_length = len(article_text)
         
-        # Patterns for different subsection types
-        patterns = [
-            (r'^([۰-۹]+)\s*[-–—]\s*(.+?)(?=^[۰-۹]+\s*[-–—]|\Z)', 'numbered'),
-            (r'^([الف-ی]+)\s*[-–—]\s*(.+?)(?=^[الف-ی]+\s*[-–—]|\Z)', 'lettered'),
-            (r'^[-–—]\s*(.+?)(?=^[-–—]|\Z)', 'dash')
-        ]
-        
-        for pattern, subsection_type in patterns:
-            matches = re.finditer(pattern, article_text, re.MULTILINE | re.DOTALL)
+        for header_pattern, subsection_type in _SUBSECTION_HEADERS:
+            headers = header_pattern.finditer(article_text)
+            header = next(headers, None)
             
-            for match in matches:
-                if subsection_type == 'dash':
-                    number = '-'
-                    content = match.group(1).strip()
-                else:
-                    number = match.group(1).strip()
-                    content = match.group(2).strip()
+            while header is not None:
+                body_start = header.end()
+                
+                # The body needs at least one character, so a header starting
+                # right where this body starts does not end it (and is not
+                # parsed as a subsection of its own)
+                following = next(headers, None)
+                if following is not None and following.start() <= body_start:
+                    following = next(headers, None)
+                body_end = following.start() if following is not None else text_length
+                
+                number = '-' if subsection_type == 'dash' else header.group(1).strip()
+                content = article_text[body_start:body_end].strip()
                 
                 if content:
                     # Extract keywords for subsection
                     keywords = self.text_processor.extract_keywords(content, max_keywords=5)
                     
-                    subsections.append(LegalSubsection(
+                    subsections.append((body_start, LegalSubsection(
                         number=number,
                         content=content,
                         type=subsection_type,
                         keywords=keywords
-                    ))
+                    )))
+                
+                header = following
         
         # Sort subsections by their position in text
-        return sorted(subsections, key=lambda x: article_text.find(x.content))
+        subsections.sort(key=lambda item: item[0])
+        return [subsection for _, subsection in subsections]
     
     def extract_notes(self, article_text: str) -> List[LegalNote]:
         """
@@ -300,25 +356,23 @@ class LegalDocumentParser:
             List[LegalNote]: List of notes
         """
         notes = []
-        note_pattern = DOCUMENT_CONFIG["note_pattern"]
-        
-        # Find all note matches
-        note_matches = list(re.finditer(note_pattern, article_text, re.MULTILINE))
+        note_pattern = COMPILED_PATTERNS["note_pattern"]
         
-        for i, match in enumerate(note_matches):
-            note_num = match.group(1).strip()
+        # Each note ends where the next one starts
+        for match, note_end in _with_next_start(note_pattern.finditer(article_text), len(article_text)):
             note_start = match.start()
+            note_num = match.group(1).strip()
             
-            # Determine note end position
-            if i + 1 < len(note_matches):
-                note_end = note_matches[i + 1].start()
+            # The header match already runs to the end of its line. When only
+            # whitespace follows it, anchoring the header again would remove
+            # the whole note, so skip the second scan.
+            if article_text[match.end():note_end].strip():
+                note_text = article_text[note_start:note_end].strip()
+                
+                # Remove the note header from content
+                note_content = _NOTE_HEADER_RE.sub('', note_text, count=1).strip()
             else:
-                note_end = len(article_text)
-            
-            note_text = article_text[note_start:note_end].strip()
-            
-            # Remove the note header from content
-            note_content = re.sub(note_pattern, '', note_text, count=1).strip()
+                note_content = ''
             
             # Extract subsections within the note
             note_subsections = self.extract_subsections(note_content)
@@ -346,15 +400,29 @@ class LegalDocumentParser:
             List[str]: List of footnotes
         """
         footnotes = []
-        footnote_pattern = DOCUMENT_CONFIG["footnote_pattern"]
+        text_length = len(text)
+        pos = 0
         
-        # Find footnote references
-        footnote_matches = re.finditer(footnote_pattern + r'(.+?)(?=\(\d+\)|\Z)', text, re.DOTALL)
-        
-        for match in footnote_matches:
-            footnote_text = match.group(1).strip()
+        # Find footnote markers; each footnote runs to the next reference
+        while True:
+            marker = _FOOTNOTE_MARKER_RE.search(text, pos)
+            if marker is None:
+                break
+            
+            body_start = marker.end()
+            if body_start >= text_length:
+                # A footnote needs at least one character of text
+                pos = marker.start() + 1
+                continue
+            
+            next_reference = _FOOTNOTE_END_RE.search(text, body_start + 1)
+            body_end = next_reference.start() if next_reference else text_length
+            
+            footnote_text = text[body_start:body_end].strip()
             if footnote_text:
                 footnotes.append(footnote_text)
+            
+            pos = body_end
         
         return footnotes
     
@@ -374,8 +442,8 @@ class LegalDocumentParser:
         cleaned_text = self.text_processor.clean_text(article_text)
         
         # Remove the article header from content
-        content_text = re.sub(DOCUMENT_CONFIG["article_pattern"], '', cleaned_text, count=1)
-        content_text = re.sub(DOCUMENT_CONFIG["single_article_pattern"], '', content_text, count=1)
+        content_text = _ARTICLE_HEADER_RE.sub('', cleaned_text, count=1)
+        content_text = _SINGLE_ARTICLE_HEADER_RE.sub('', content_text, count=1)
         content_text = content_text.strip()
         
         # Extract components
@@ -391,7 +459,12 @@ class LegalDocumentParser:
         for subsection in subsections:
             main_content = main_content.replace(subsection.content, '')
         
-        main_content = re.sub(r'\s+', ' ', main_content).strip()
+        # split() breaks on the same Unicode whitespace as \s (ZWNJ is not
+        # whitespace) and drops the ends, so this collapses and strips at once
+        main_content = ' '.join(main_content.split())
+        # Whitespace is already collapsed to single spaces, so counting them
+        # gives the word count without splitting the content again
+        word_count = main_content.count(' ') + 1 if main_content else 0
         
         # Extract keywords
         keywords = self.text_processor.extract_keywords(cleaned_text, max_keywords=10)
@@ -402,28 +475,32 @@ class LegalDocumentParser:
             content=main_content,
             subsections=subsections,
             notes=notes,
-            keywords=keywords
+            keywords=keywords,
+            word_count=word_count
         )
     
-    def parse_chapter(self, chapter_text: str, chapter_num: str, chapter_title: str) -> LegalChapter:
+    def parse_chapter(self, text: str, chapter_num: str, chapter_title: str,
+                      start_pos: int = 0, end_pos: Optional[int] = None) -> LegalChapter:
         """
         Parse a single chapter
         
         Args:
-            chapter_text (str): Chapter text
+            text (str): Chapter text, or the document text containing the chapter
             chapter_num (str): Chapter number
             chapter_title (str): Chapter title
+            start_pos (int): Offset where the chapter starts in text
+            end_pos (Optional[int]): Offset where the chapter ends (end of text if None)
             
         Returns:
             LegalChapter: Parsed chapter
         """
         articles = []
         
-        # Extract articles within this chapter
-        article_data = self.extract_articles(chapter_text)
+        # Extract articles within this chapter's range, without copying it out
+        article_data = self.extract_articles(text, start_pos, end_pos)
         
-        for article_num, article_title, start_pos, end_pos in article_data:
-            article_text = chapter_text[start_pos:end_pos]
+        for article_num, article_title, article_start, article_end in article_data:
+            article_text = text[article_start:article_end]
             article = self.parse_article(article_text, article_num, article_title)
             articles.append(article)
             self.parsing_stats['articles_extracted'] += 1
@@ -459,8 +536,7 @@ class LegalDocumentParser:
             processed_ranges = []  # Track processed text ranges
             
             for chapter_num, chapter_title, start_pos, end_pos in chapter_data:
-                chapter_text = text[start_pos:end_pos]
-                chapter = self.parse_chapter(chapter_text, chapter_num, chapter_title)
+                chapter = self.parse_chapter(text, chapter_num, chapter_title, start_pos, end_pos)
                 chapters.append(chapter)
                 processed_ranges.append((start_pos, end_pos))
                 self.parsing_stats['chapters_found'] += 1
@@ -480,13 +556,9 @@ class LegalDocumentParser:
             # Extract footnotes
             footnotes = self.extract_footnotes(text)
             
-            # Count notes
-            for chapter in chapters:
-                for article in chapter.articles:
-                    self.parsing_stats['notes_extracted'] += len(article.notes)
-            
-            for article in standalone_articles:
-                self.parsing_stats['notes_extracted'] += len(article.notes)
+            # Count notes, updating the shared stats once per document
+            all_articles = itertools.chain(standalone_articles, *(chapter.articles for chapter in chapters))
+            self.parsing_stats['notes_extracted'] += sum(len(article.notes) for article in all_articles)
             
             # Create metadata
             metadata = {
@@ -507,7 +579,8 @@ class LegalDocumentParser:
                 chapters=chapters,
                 standalone_articles=standalone_articles,
                 footnotes=footnotes,
-                metadata=metadata
+                metadata=metadata,
+                parsing_timestamp=self._parsing_timestamp
             )
             
             self.parsing_stats['documents_parsed'] += 1
@@ -557,33 +630,52 @@ class LegalDocumentParser:
         
         return min(score, 1.0)
     
-    def parse_documents_batch(self, input_file: str, output_file: str = None) -> List[ParsedLegalDocument]:
+    def parse_documents_batch(self, input_file: str, output_file: str = None,
+                              max_workers: Optional[int] = 1) -> List[ParsedLegalDocument]:
         """
         Parse multiple legal documents from individual laws file
         
         Args:
             input_file (str): Path to individual laws JSON file
             output_file (str): Optional output file path
+            max_workers (Optional[int]): Worker processes to parse with; 1 (default)
+                parses in this process and None uses all CPUs
             
         Returns:
             List[ParsedLegalDocument]: List of parsed documents
         """
         parsed_documents = []
+        # Documents of one batch share a single parsing timestamp
+        self._parsing_timestamp = datetime.now().isoformat()
         
         try:
             with open(input_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                laws = json.load(f).get('laws', [])
             
-            laws = data.get('laws', [])
             print(f"در حال تجزیه {len(laws)} سند حقوقی...")
             
-            for i, law_dict in enumerate(laws):
-                try:
-                    parsed_doc = self.parse_document_from_dict(law_dict)
+            workers = min(max_workers or os.cpu_count() or 1, len(laws))
+            
+            if workers > 1:
+                # Each worker builds its own parser; results come back in order
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_parser,
+                                         initargs=(self._parsing_timestamp,)) as executor:
+                    chunksize = max(1, len(laws) // (workers * 4))
+                    results = list(executor.map(_parse_in_worker, laws, chunksize=chunksize))
+            else:
+                results = (_parse_with_stats(self, law_dict) for law_dict in laws)
+            
+            for i, (parsed_doc, error, stats) in enumerate(results):
+                if workers > 1:
+                    # Worker stats were counted on the worker's parser
+                    for key, value in stats.items():
+                        self.parsing_stats[key] += value
+                
+                if error is None:
                     parsed_documents.append(parsed_doc)
                     print(f"✓ تجزیه شد ({i+1}/{len(laws)}): {parsed_doc.title[:50]}...")
-                except Exception as e:
-                    print(f"✗ خطا در تجزیه ({i+1}/{len(laws)}): {str(e)}")
+                else:
+                    print(f"✗ خطا در تجزیه ({i+1}/{len(laws)}): {error}")
             
             # Save results if output file specified
             if output_file:
@@ -596,11 +688,17 @@ class LegalDocumentParser:
             print(f"   - فصل‌های پیدا شده: {stats['chapters_found']}")
             print(f"   - تبصره‌های استخراج شده: {stats['notes_extracted']}")
             
+            # Repeated boilerplate only hits the keyword cache within a batch
+            self.text_processor.clear_caches()
+            
             return parsed_documents
         
         except Exception as e:
             print(f"خطا در بارگذاری فایل قوانین: {str(e)}")
             return []
+        
+        finally:
+            self._parsing_timestamp = None
     
     def save_parsed_documents(self, parsed_docs: List[ParsedLegalDocument], output_file: str) -> None:
         """
@@ -611,26 +709,106 @@ class LegalDocumentParser:
             output_file (str): Output file path
         """
         try:
-            output_data = {
-                'metadata': {
-                    'total_documents': len(parsed_docs),
-                    'parsing_date': datetime.now().isoformat(),
-                    'parsing_stats': self.parsing_stats
-                },
-                'documents': [asdict(doc) for doc in parsed_docs]
+            metadata = {
+                'total_documents': len(parsed_docs),
+                'parsing_date': datetime.now().isoformat(),
+                'parsing_stats': self.parsing_stats
             }
             
             output_path = Path(output_file)
             output_path.parent.mkdir(exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=2)
+            # Convert and write one document at a time instead of building
+            # the dict form of every document first
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write('{"metadata": ')
+                f.write(json.dumps(metadata, ensure_ascii=False))
+                f.write(', "documents": [')
+                
+                for i, doc in enumerate(parsed_docs):
+                    if i:
+                        f.write(', ')
+                    f.write(_DOCUMENT_ENCODER.encode(doc))
+                
+                f.write(']}')
             
             print(f"✓ اسناد تجزیه شده ذخیره شدند: {output_path}")
         
         except Exception as e:
             print(f"خطا در ذخیره اسناد تجزیه شده: {str(e)}")
     
+    def to_legal_document(self, parsed_doc: ParsedLegalDocument, raw_content: Optional[str] = None) -> models.LegalDocument:
+        """
+        Convert a parsed document into the pipeline's LegalDocument model
+        
+        The nested structures come straight from this parser, so they are
+        built without re-validation (articles may legitimately have empty
+        main content once their subsections and notes are taken out).
+        
+        Args:
+            parsed_doc (ParsedLegalDocument): Document returned by parse_document_from_dict
+            raw_content (Optional[str]): Original law text to keep on the document
+            
+        Returns:
+            models.LegalDocument: Equivalent document model
+        """
+        def convert_subsection(subsection: LegalSubsection) -> models.LegalSubsection:
+            return models.LegalSubsection.fast_build(
+                number=subsection.number,
+                content=subsection.content,
+                type=models.SubsectionType(subsection.type),
+                keywords=subsection.keywords
+            )
+        
+        def convert_article(article: LegalArticle) -> models.LegalArticle:
+            return models.LegalArticle.fast_build(
+                number=article.number,
+                title=article.title,
+                content=article.content,
+                subsections=[convert_subsection(sub) for sub in article.subsections],
+                notes=[
+                    models.LegalNote.fast_build(
+                        number=note.number,
+                        content=note.content,
+                        subsections=[convert_subsection(sub) for sub in note.subsections],
+                        keywords=note.keywords
+                    )
+                    for note in article.notes
+                ],
+                keywords=article.keywords,
+                word_count=article.word_count
+            )
+        
+        metadata = parsed_doc.metadata
+        
+        return models.LegalDocument(
+            id=parsed_doc.id,
+            title=parsed_doc.title,
+            approval_date=parsed_doc.approval_date,
+            approval_authority=parsed_doc.approval_authority,
+            document_type=parsed_doc.document_type,
+            chapters=[
+                models.LegalChapter(
+                    number=chapter.number,
+                    title=chapter.title,
+                    articles=[convert_article(article) for article in chapter.articles],
+                    summary=chapter.summary
+                )
+                for chapter in parsed_doc.chapters
+            ],
+            standalone_articles=[convert_article(article) for article in parsed_doc.standalone_articles],
+            footnotes=parsed_doc.footnotes,
+            metadata=models.DocumentMetadata(
+                word_count=metadata.get('word_count', 0),
+                character_count=metadata.get('character_count', 0),
+                structure_type=metadata.get('structure_type', 'نامشخص'),
+                has_footnotes=metadata.get('has_footnotes', False),
+                complexity_score=metadata.get('complexity_score', 0.0),
+                quality_score=metadata.get('original_quality_score', 0.0)
+            ),
+            raw_content=raw_content
+        )
+    
     def get_parsing_statistics(self) -> Dict:
         """
         Get parsing statistics
@@ -641,6 +819,42 @@ class LegalDocumentParser:
         return self.parsing_stats.copy()
 
 
+# Parser owned by a parse_documents_batch worker process
+_worker_parser: Optional[LegalDocumentParser] = None
+
+
+def _init_worker_parser(parsing_timestamp: Optional[str]) -> None:
+    """Create the parser used by this worker process, stamping the batch's timestamp"""
+    global _worker_parser
+    _worker_parser = LegalDocumentParser()
+    _worker_parser._parsing_timestamp = parsing_timestamp
+
+
+def _parse_with_stats(parser: LegalDocumentParser, law_dict: Dict) -> Tuple[Optional[ParsedLegalDocument], Optional[str], Dict]:
+    """
+    Parse one law, catching its error
+    
+    Returns:
+        Tuple: (parsed document or None, error message or None, parsing stats delta)
+    """
+    stats_before = parser.parsing_stats.copy()
+    
+    try:
+        parsed_doc, error = parser.parse_document_from_dict(law_dict), None
+    except Exception as e:
+        parsed_doc, error = None, str(e)
+    
+    # Failed parses still count in parsing_errors
+    return parsed_doc, error, {
+        key: value - stats_before[key] for key, value in parser.parsing_stats.items()
+    }
+
+
+def _parse_in_worker(law_dict: Dict) -> Tuple[Optional[ParsedLegalDocument], Optional[str], Dict]:
+    """Parse one law with the worker process's parser"""
+    return _parse_with_stats(_worker_parser, law_dict)
+
+
 def parse_legal_documents(input_file: str, output_file: str = None) -> List[ParsedLegalDocument]:
     """
     Convenience function to parse legal documents from individual laws file
@@ -4,7 +4,12 @@ Document splitter for Legal Assistant
 Automatically splits the complete Part2_Legals.docx file into individual laws
 """
 
+import functools
+import itertools
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.pool import Pool
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 import json
@@ -12,10 +17,28 @@ from docx import Document
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
-from ..core.config import DOCUMENT_CONFIG, OUTPUT_FILES, QUALITY_ASSURANCE
+from ..core.config import DOCUMENT_CONFIG, COMPILED_PATTERNS, OUTPUT_FILES, QUALITY_ASSURANCE
 from ..utils.text_utils import PersianTextProcessor
 
 
+# A separator of the form "N or more copies of one character" (e.g. \*{10,})
+# is located with str.find instead of the regex engine
+_SEPARATOR_RUN = re.fullmatch(r'\\(.)\{(\d+),\}', DOCUMENT_CONFIG["law_separator"])
+
+# Approval date inside a title's (مصوب ...) part. \d matches Persian digits
+# too, so one branch covers both digit sets; a 4-digit year is preferred
+# over a 2-digit one.
+_APPROVAL_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/(?:\d{4}|\d{2}))')
+
+# Legal structure indicators; none can overlap another, so one scan sees
+# every indicator present in the text
+_LEGAL_INDICATOR_RE = re.compile('ماده|تبصره|بند|فصل')
+
+# Article headers that mark properly formatted legal text
+_NUMBERED_ARTICLE_RE = re.compile(r'ماده\s*[۰-۹]+')
+_SINGLE_ARTICLE_RE = re.compile(r'ماده\s*واحده')
+
+
 @dataclass
 class LawMetadata:
     """Metadata structure for individual laws"""
@@ -29,6 +52,26 @@ class LawMetadata:
     quality_score: float
 
 
+@functools.lru_cache(maxsize=4)
+def _load_docx_text(file_path: str, mtime_ns: int) -> str:
+    """
+    Extract the non-empty paragraphs of a DOCX file, memoized per process
+    
+    Args:
+        file_path (str): Resolved path to the DOCX file
+        mtime_ns (int): File modification time; a changed file misses the cache
+        
+    Returns:
+        str: Extracted text content
+    """
+    doc = Document(file_path)
+    
+    # paragraph.text rebuilds the text from its runs on every access, so
+    # read and strip each paragraph once
+    stripped = (paragraph.text.strip() for paragraph in doc.paragraphs)
+    return '\n'.join(text for text in stripped if text)
+
+
 class DocumentSplitter:
     """
     Splits the main legal document file into individual laws
@@ -44,11 +87,26 @@ class DocumentSplitter:
             'extraction_errors': 0,
             'processing_time': 0
         }
+        # Shared extraction timestamp while split_document runs
+        self._extraction_timestamp: Optional[str] = None
+    
+    @property
+    def laws(self) -> List[LawMetadata]:
+        """Extracted laws; assigning a new list resets the ID index"""
+        return self._laws
+    
+    @laws.setter
+    def laws(self, laws: List[LawMetadata]) -> None:
+        self._laws = laws
+        self._law_index = None
     
     def read_docx_file(self, file_path: str) -> str:
         """
         Read content from DOCX file
         
+        Repeated reads of an unchanged file reuse the extracted text
+        instead of unzipping and parsing the document again.
+        
         Args:
             file_path (str): Path to the DOCX file
             
@@ -56,14 +114,8 @@ class DocumentSplitter:
             str: Extracted text content
         """
         try:
-            doc = Document(file_path)
-            full_text = []
-            
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    full_text.append(paragraph.text.strip())
-            
-            return '\n'.join(full_text)
+            path = Path(file_path).resolve()
+            return _load_docx_text(str(path), path.stat().st_mtime_ns)
         
         except Exception as e:
             raise Exception(f"خطا در خواندن فایل DOCX: {str(e)}")
@@ -79,11 +131,7 @@ class DocumentSplitter:
             List[Tuple[int, int]]: List of (start, end) positions for each law
         """
         # Find law separators (10 or more asterisks)
-        separator_pattern = DOCUMENT_CONFIG["law_separator"]
-        separators = []
-        
-        for match in re.finditer(separator_pattern, text):
-            separators.append(match.end())
+        separators = self._find_separator_ends(text)
         
         # Create boundaries
         boundaries = []
@@ -100,26 +148,55 @@ class DocumentSplitter:
         
         return boundaries
     
-    def extract_law_title_and_date(self, law_text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    @staticmethod
+    def _find_separator_ends(text: str) -> List[int]:
+        """
+        Find where each law separator ends
+        
+        Args:
+            text (str): Complete document text
+            
+        Returns:
+            List[int]: End position of every separator, in order
+        """
+        if _SEPARATOR_RUN is None:
+            return [match.end() for match in COMPILED_PATTERNS["law_separator"].finditer(text)]
+        
+        char = _SEPARATOR_RUN.group(1)
+        run = char * int(_SEPARATOR_RUN.group(2))
+        text_length = len(text)
+        ends = []
+        
+        pos = text.find(run)
+        while pos != -1:
+            # Extend the separator over the rest of the run
+            end = pos + len(run)
+            while end < text_length and text[end] == char:
+                end += 1
+            
+            ends.append(end)
+            pos = text.find(run, end)
+        
+        return ends
+    
+    def extract_law_title_and_date(self, cleaned_text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Extract law title, approval date, and authority from law text
         
         Args:
-            law_text (str): Individual law text
+            cleaned_text (str): Individual law text, already passed through
+                text_processor.clean_text
             
         Returns:
             Tuple: (title, approval_date, approval_authority)
         """
-        # Clean the text first
-        cleaned_text = self.text_processor.clean_text(law_text)
-        
         # Look for title pattern in first few lines
         lines = cleaned_text.split('\n')[:5]
         first_content = ' '.join(lines).strip()
         
         # Pattern: Title (مصوب date)
-        title_pattern = DOCUMENT_CONFIG["law_title_pattern"]
-        match = re.search(title_pattern, first_content)
+        title_pattern = COMPILED_PATTERNS["law_title_pattern"]
+        match = title_pattern.search(first_content)
         
         if match:
             title = match.group(1).strip()
@@ -133,7 +210,7 @@ class DocumentSplitter:
                 authority = "شورای عالی انقلاب فرهنگی"
             
             # Clean date (extract just the date part)
-            date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4}|\d{1,2}/\d{1,2}/\d{2}|[۰-۹]{1,2}/[۰-۹]{1,2}/[۰-۹]{4}|[۰-۹]{1,2}/[۰-۹]{1,2}/[۰-۹]{2})', date_info)
+            date_match = _APPROVAL_DATE_RE.search(date_info)
             approval_date = date_match.group(1) if date_match else date_info
             
             return title, approval_date, authority
@@ -174,13 +251,15 @@ class DocumentSplitter:
             score += 0.2
         
         # Check for legal structure indicators
-        legal_indicators = ['ماده', 'تبصره', 'بند', 'فصل']
-        indicator_count = sum(1 for indicator in legal_indicators if indicator in law_text)
-        if indicator_count >= 2:
-            score += 0.2
+        indicators_found = set()
+        for match in _LEGAL_INDICATOR_RE.finditer(law_text):
+            indicators_found.add(match.group())
+            if len(indicators_found) >= 2:
+                score += 0.2
+                break
         
         # Check for proper legal formatting
-        if re.search(r'ماده\s*[۰-۹]+', law_text) or re.search(r'ماده\s*واحده', law_text):
+        if _NUMBERED_ARTICLE_RE.search(law_text) or _SINGLE_ARTICLE_RE.search(law_text):
             score += 0.2
         
         return min(score, 1.0)
@@ -204,7 +283,7 @@ class DocumentSplitter:
             if len(cleaned_text) < QUALITY_ASSURANCE["min_law_length"]:
                 return None
             
-            # Extract title and metadata
+            # Extract title and metadata (from the already cleaned text)
             title, approval_date, approval_authority = self.extract_law_title_and_date(cleaned_text)
             
             if not title:
@@ -232,7 +311,7 @@ class DocumentSplitter:
                 approval_authority=approval_authority or "نامشخص",
                 raw_content=cleaned_text,
                 word_count=len(cleaned_text.split()),
-                extraction_timestamp=datetime.now().isoformat(),
+                extraction_timestamp=self._extraction_timestamp or datetime.now().isoformat(),
                 quality_score=quality_score
             )
             
@@ -243,17 +322,26 @@ class DocumentSplitter:
             self.processing_stats['extraction_errors'] += 1
             return None
     
-    def split_document(self, input_file_path: str) -> Dict:
+    def split_document(self, input_file_path: str, max_workers: Optional[int] = 1,
+                       save_results: bool = True, pool: Optional[Pool] = None) -> Dict:
         """
         Main method to split the complete document into individual laws
         
         Args:
             input_file_path (str): Path to input DOCX file
+            max_workers (Optional[int]): Worker processes for per-law processing;
+                1 (default) processes laws in this process and None uses all CPUs
+            save_results (bool): Save the laws and processing report; callers
+                combining several documents save once themselves
+            pool (Optional[Pool]): Existing worker pool to process laws in,
+                used instead of starting one; overrides max_workers
             
         Returns:
             Dict: Processing results and statistics
         """
         start_time = datetime.now()
+        # Laws split from one document share its extraction timestamp
+        self._extraction_timestamp = start_time.isoformat()
         
         try:
             print("در حال خواندن فایل اصلی...")
@@ -269,19 +357,49 @@ class DocumentSplitter:
             print("در حال پردازش قوانین جداگانه...")
             valid_laws = []
             
+            # Non-empty law texts with their index among all boundaries
+            law_indices = []
+            law_texts = []
             for i, (start, end) in enumerate(boundaries):
                 law_text = full_text[start:end].strip()
-                
                 if law_text:
-                    metadata = self.process_individual_law(law_text, i)
-                    
-                    if metadata and metadata.quality_score >= 0.4:  # Minimum quality threshold
-                        valid_laws.append(metadata)
-                        self.processing_stats['valid_laws'] += 1
-                        print(f"✓ قانون {i+1}: {metadata.title[:50]}...")
-                    else:
-                        self.processing_stats['invalid_laws'] += 1
-                        print(f"✗ قانون {i+1}: کیفیت پایین یا نامعتبر")
+                    law_indices.append(i)
+                    law_texts.append(law_text)
+            
+            if pool is not None:
+                # Only used to size task chunks for the given pool
+                workers = os.cpu_count() or 1
+            else:
+                workers = min(max_workers or os.cpu_count() or 1, len(law_texts))
+            in_workers = pool is not None or workers > 1
+            timestamps = itertools.repeat(self._extraction_timestamp)
+            
+            if in_workers:
+                # Each worker process keeps its own splitter; results come back in order
+                chunksize = max(1, len(law_texts) // (workers * 4))
+                if pool is not None:
+                    results = pool.starmap(_process_in_worker, zip(law_texts, law_indices, timestamps),
+                                           chunksize=chunksize)
+                else:
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        results = list(executor.map(_process_in_worker, law_texts, law_indices, timestamps,
+                                                    chunksize=chunksize))
+            else:
+                results = (_process_with_stats(self, law_text, i) for law_text, i in zip(law_texts, law_indices))
+            
+            for i, (metadata, stats) in zip(law_indices, results):
+                if in_workers:
+                    # Worker errors were counted on the worker's splitter
+                    for key, value in stats.items():
+                        self.processing_stats[key] += value
+                
+                if metadata and metadata.quality_score >= 0.4:  # Minimum quality threshold
+                    valid_laws.append(metadata)
+                    self.processing_stats['valid_laws'] += 1
+                    print(f"✓ قانون {i+1}: {metadata.title[:50]}...")
+                else:
+                    self.processing_stats['invalid_laws'] += 1
+                    print(f"✗ قانون {i+1}: کیفیت پایین یا نامعتبر")
             
             self.laws = valid_laws
             
@@ -290,8 +408,9 @@ class DocumentSplitter:
             self.processing_stats['processing_time'] = (end_time - start_time).total_seconds()
             
             # Save results
-            self.save_individual_laws()
-            self.save_processing_report()
+            if save_results:
+                self.save_individual_laws()
+                self.save_processing_report()
             
             print(f"\n✅ پردازش کامل شد:")
             print(f"   - تعداد کل قوانین: {self.processing_stats['total_laws_found']}")
@@ -313,10 +432,16 @@ class DocumentSplitter:
                 'error': error_msg,
                 'stats': self.processing_stats
             }
+        
+        finally:
+            self._extraction_timestamp = None
     
-    def save_individual_laws(self) -> None:
+    def save_individual_laws(self) -> bool:
         """
         Save individual laws to JSON file
+        
+        Returns:
+            bool: True if the file was written
         """
         try:
             laws_data = {
@@ -332,12 +457,14 @@ class DocumentSplitter:
             output_file.parent.mkdir(exist_ok=True)
             
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(laws_data, f, ensure_ascii=False, indent=2)
+                json.dump(laws_data, f, ensure_ascii=False)
             
             print(f"✓ قوانین جداگانه در فایل ذخیره شدند: {output_file}")
+            return True
         
         except Exception as e:
             print(f"خطا در ذخیره قوانین جداگانه: {str(e)}")
+            return False
     
     def save_processing_report(self) -> None:
         """
@@ -355,7 +482,7 @@ class DocumentSplitter:
             output_file.parent.mkdir(exist_ok=True)
             
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, ensure_ascii=False, indent=2)
+                json.dump(report, f, ensure_ascii=False)
             
             print(f"✓ گزارش پردازش ذخیره شد: {output_file}")
         
@@ -372,20 +499,35 @@ class DocumentSplitter:
         if not self.laws:
             return {'average_quality': 0, 'quality_distribution': {}}
         
-        quality_scores = [law.quality_score for law in self.laws]
+        quality_distribution = {'excellent': 0, 'good': 0, 'fair': 0, 'poor': 0}
+        total_quality = 0
+        highest_quality = float('-inf')
+        lowest_quality = float('inf')
         
-        quality_distribution = {
-            'excellent': len([s for s in quality_scores if s >= 0.8]),
-            'good': len([s for s in quality_scores if 0.6 <= s < 0.8]),
-            'fair': len([s for s in quality_scores if 0.4 <= s < 0.6]),
-            'poor': len([s for s in quality_scores if s < 0.4])
-        }
+        # Bucket and summarize the scores in a single pass
+        for law in self.laws:
+            score = law.quality_score
+            total_quality += score
+            
+            if score >= 0.8:
+                quality_distribution['excellent'] += 1
+            elif score >= 0.6:
+                quality_distribution['good'] += 1
+            elif score >= 0.4:
+                quality_distribution['fair'] += 1
+            else:
+                quality_distribution['poor'] += 1
+            
+            if score > highest_quality:
+                highest_quality = score
+            if score < lowest_quality:
+                lowest_quality = score
         
         return {
-            'average_quality': sum(quality_scores) / len(quality_scores),
+            'average_quality': total_quality / len(self.laws),
             'quality_distribution': quality_distribution,
-            'highest_quality': max(quality_scores),
-            'lowest_quality': min(quality_scores)
+            'highest_quality': highest_quality,
+            'lowest_quality': lowest_quality
         }
     
     def generate_recommendations(self) -> List[str]:
@@ -425,10 +567,11 @@ class DocumentSplitter:
         Returns:
             Optional[LawMetadata]: Law metadata if found
         """
-        for law in self.laws:
-            if law.id == law_id:
-                return law
-        return None
+        if self._law_index is None:
+            # Built on first lookup; reversed so a duplicate ID maps to its first law
+            self._law_index = {law.id: law for law in reversed(self._laws)}
+        
+        return self._law_index.get(law_id)
     
     def get_laws_by_date_range(self, start_date: str, end_date: str) -> List[LawMetadata]:
         """
@@ -466,6 +609,35 @@ class DocumentSplitter:
         }
 
 
+# Splitter owned by a split_document worker process
+_worker_splitter: Optional[DocumentSplitter] = None
+
+
+def _process_with_stats(splitter: DocumentSplitter, law_text: str, law_index: int) -> Tuple[Optional[LawMetadata], Dict]:
+    """
+    Process one law
+    
+    Returns:
+        Tuple: (law metadata or None, processing stats delta)
+    """
+    stats_before = splitter.processing_stats.copy()
+    metadata = splitter.process_individual_law(law_text, law_index)
+    
+    return metadata, {
+        key: value - stats_before[key] for key, value in splitter.processing_stats.items()
+    }
+
+
+def _process_in_worker(law_text: str, law_index: int,
+                       extraction_timestamp: Optional[str]) -> Tuple[Optional[LawMetadata], Dict]:
+    """Process one law with the worker process's splitter, stamping the split's timestamp"""
+    global _worker_splitter
+    if _worker_splitter is None:
+        _worker_splitter = DocumentSplitter()
+    _worker_splitter._extraction_timestamp = extraction_timestamp
+    return _process_with_stats(_worker_splitter, law_text, law_index)
+
+
 def split_legal_document(input_file_path: str) -> Dict:
     """
     Convenience function to split legal document
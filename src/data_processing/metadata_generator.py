@@ -589,8 +589,8 @@ class MetadataGenerator:
                     {
                         'document_id': doc.id,
                         'title': doc.title,
-                        'quality_assessment': self.assess_document_quality(doc).dict(),
-                        'metadata': self.generate_document_metadata(doc).dict()
+                        'quality_assessment': self.assess_document_quality(doc).model_dump(),
+                        'metadata': self.generate_document_metadata(doc).model_dump()
                     }
                     for doc in documents
                 ],
@@ -12,7 +12,7 @@ from datetime import datetime
 
 from ..core.config import TEXT_CLEANING, PERSIAN_CONFIG
 from ..utils.text_utils import PersianTextProcessor
-from ..core.models import ProcessingReport, ProcessingStatus
+from ..core.models import LegalDocument, ProcessingReport, ProcessingStatus
 
 
 class AdvancedTextProcessor:
@@ -333,6 +333,90 @@ class AdvancedTextProcessor:
             print(f"خطا در پردازش سند {law_dict.get('id', 'نامشخص')}: {str(e)}")
             return law_dict
     
+    def process_legal_document(self, document: LegalDocument) -> LegalDocument:
+        """
+        Clean the text of a parsed LegalDocument
+        
+        Args:
+            document (LegalDocument): Document from the structure parser
+            
+        Returns:
+            LegalDocument: Copy of the document with cleaned titles and contents
+        """
+        def clean_items(items):
+            # Subsections and notes are frozen models, so update copies
+            return [
+                item.model_copy(update={'content': self.process_text_content(item.content)})
+                for item in items
+            ]
+        
+        def clean_article(article):
+            content = self.process_text_content(article.content)
+            return article.model_copy(update={
+                'title': self.persian_processor.clean_text(article.title),
+                'content': content,
+                'subsections': clean_items(article.subsections),
+                'notes': [
+                    note.model_copy(update={
+                        'content': self.process_text_content(note.content),
+                        'subsections': clean_items(note.subsections)
+                    })
+                    for note in article.notes
+                ],
+                'word_count': len(content.split())
+            })
+        
+        update = {
+            'title': self.persian_processor.clean_text(document.title),
+            'chapters': [
+                chapter.model_copy(update={
+                    'title': self.persian_processor.clean_text(chapter.title),
+                    'articles': [clean_article(article) for article in chapter.articles]
+                })
+                for chapter in document.chapters
+            ],
+            'standalone_articles': [clean_article(article) for article in document.standalone_articles],
+            'footnotes': [self.persian_processor.clean_text(footnote) for footnote in document.footnotes]
+        }
+        
+        if document.raw_content:
+            raw_content = self.process_text_content(document.raw_content)
+            update['raw_content'] = raw_content
+            update['metadata'] = document.metadata.model_copy(update={
+                'word_count': len(raw_content.split()),
+                'character_count': len(raw_content)
+            })
+        
+        self.processing_stats['documents_processed'] += 1
+        self.processing_stats['text_cleaned'] += 1
+        self.processing_stats['normalization_applied'] += 1
+        
+        return document.model_copy(update=update)
+    
+    def process_legal_documents(self, documents: List[LegalDocument]) -> Tuple[List[LegalDocument], ProcessingReport]:
+        """
+        Clean the text of parsed LegalDocuments
+        
+        Args:
+            documents (List[LegalDocument]): Documents from the structure parser
+            
+        Returns:
+            Tuple[List[LegalDocument], ProcessingReport]: Processed documents and report
+        """
+        report = ProcessingReport(
+            operation_type="text_processing",
+            total_items=len(documents),
+            status=ProcessingStatus.PROCESSING
+        )
+        
+        processed_docs = [self.process_legal_document(document) for document in documents]
+        report.processed_items = len(processed_docs)
+        
+        report.finish()
+        report.statistics = self.processing_stats.copy()
+        
+        return processed_docs, report
+    
     def process_documents_batch(self, input_file: str, output_file: str = None) -> Tuple[List[Dict], ProcessingReport]:
         """
         Process multiple documents in batch from individual_laws.json
@@ -381,8 +465,7 @@ class AdvancedTextProcessor:
                     processed_laws.append(law_dict)
             
             # Update report
-            report.end_time = datetime.now()
-            report.status = ProcessingStatus.COMPLETED
+            report.finish()
             report.statistics = self.processing_stats.copy()
             
             # Save results if output file specified
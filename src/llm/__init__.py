@@ -1 +1,33 @@
- 
+# ===============================================
+# src/llm/__init__.py
+# ===============================================
+"""
+LLM interface modules for Legal Assistant
+Contains prompt templates, response generation, and LLM communication
+
+Note: This package will be implemented in Phase 2
+"""
+
+# Placeholder for Phase 2 development
+__version__ = "0.0.0"
+__status__ = "planned"
+
+# Future imports (to be implemented in Phase 2)
+# from .llm_interface import LLMInterface
+# from .prompt_templates import LegalPromptTemplates
+# from .response_generator import ResponseGenerator
+
+__all__ = []
+
+def get_phase_info():
+    """Get information about LLM module development status"""
+    return {
+        "phase": 2,
+        "status": "not_implemented",
+        "description": "LLM interface functionality will be available in Phase 2", 
+        "planned_modules": [
+            "llm_interface.py",
+            "prompt_templates.py",
+            "response_generator.py"
+        ]
+    }
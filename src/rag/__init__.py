@@ -1 +1,35 @@
- 
+# ===============================================
+# src/rag/__init__.py
+# ===============================================
+"""
+RAG (Retrieval-Augmented Generation) modules for Legal Assistant
+Contains embedding, vector store, retrieval, and LLM interface components
+
+Note: This package will be implemented in Phase 2
+"""
+
+# Placeholder for Phase 2 development
+__version__ = "0.0.0"
+__status__ = "planned"
+
+# Future imports (to be implemented in Phase 2)
+# from .embedding_manager import EmbeddingManager
+# from .vector_store import VectorStore
+# from .retriever import LegalRetriever
+# from .rag_pipeline import LegalRAGPipeline
+
+__all__ = []
+
+def get_phase_info():
+    """Get information about RAG module development status"""
+    return {
+        "phase": 2,
+        "status": "not_implemented",
+        "description": "RAG functionality will be available in Phase 2",
+        "planned_modules": [
+            "embedding_manager.py",
+            "vector_store.py", 
+            "retriever.py",
+            "rag_pipeline.py"
+        ]
+    }
@@ -1 +1,21 @@
- 
+# ===============================================
+# src/utils/__init__.py
+# ===============================================
+"""
+Utility modules for Legal Assistant
+Contains text processing and helper functions
+"""
+
+from .text_utils import (
+    PersianTextProcessor, 
+    clean_persian_text, 
+    extract_persian_keywords, 
+    normalize_text
+)
+
+__all__ = [
+    'PersianTextProcessor', 
+    'clean_persian_text',
+    'extract_persian_keywords', 
+    'normalize_text'
+]
@@ -5,9 +5,38 @@ Handles Persian-specific text cleaning, normalization, and analysis
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 import unicodedata
 
+# Persian sentence boundary: terminal punctuation followed by whitespace
+_SENTENCE_BOUNDARY_RE = re.compile(r'[.؟!؛]\s+')
+
+# clean_text and extract_keywords run for every article, note and chunk,
+# so their patterns are compiled once per process
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACING_RE = re.compile(r'\s*([،؛؟!.])\s*')
+_PARENTHESIS_SPACING_RE = re.compile(r'\s*([()])\s*')
+_PERSIAN_WORD_RE = re.compile(r'[\u0600-\u06FF\u200C\u200D]+')
+
+# Extraction patterns, compiled once rather than looked up per call
+_PERSIAN_NUMBER_RE = re.compile(r'[۰-۹]+(?:[./][۰-۹]+)*')
+_PERSIAN_CHAR_RE = re.compile(r'[\u0600-\u06FF]')
+_WORD_CHAR_RE = re.compile(r'[\w]')
+_DATE_PATTERNS = (
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), 'dd/mm/yyyy'),
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2})'), 'dd/mm/yy'),
+    (re.compile(r'([۰-۹]{1,2})/([۰-۹]{1,2})/([۰-۹]{4})'), 'persian_dd/mm/yyyy'),
+    (re.compile(r'([۰-۹]{1,2})/([۰-۹]{1,2})/([۰-۹]{2})'), 'persian_dd/mm/yy'),
+)
+_LEGAL_REFERENCE_PATTERNS = (
+    (re.compile(r'(ماده\s*[۰-۹]+)'), 'article'),
+    (re.compile(r'(تبصره\s*[۰-۹]*)'), 'note'),
+    (re.compile(r'(بند\s*[۰-۹]+)'), 'subsection'),
+    (re.compile(r'(فصل\s*[۰-۹]+)'), 'chapter'),
+    (re.compile(r'(قانون\s+[^.،؛]+)'), 'law_reference'),
+)
+
 class PersianTextProcessor:
     """Persian text processing utilities"""
     
@@ -19,6 +48,10 @@ class PersianTextProcessor:
             '٣': '۳', '٤': '۴', '٥': '۵', '٦': '۶', '٧': '۷', '٨': '۸', '٩': '۹'
         }
         
+        # Single-pass translate table equivalent to applying char_map's
+        # replacements in order (e.g. 'ء' -> 'ئ' -> 'ی')
+        self.char_table = str.maketrans(self._compose_char_map(self.char_map))
+        
         # Persian digits mapping
         self.persian_to_english = str.maketrans('۰۱۲۳۴۵۶۷۸۹', '0123456789')
         self.english_to_persian = str.maketrans('0123456789', '۰۱۲۳۴۵۶۷۸۹')
@@ -30,6 +63,30 @@ class PersianTextProcessor:
             'مجلس', 'شورای', 'وزیر', 'رئیس‌جمهور', 'هیئت‌وزیران',
             'تصویب', 'ابلاغ', 'اجرا', 'لغو', 'اصلاح', 'الحاق'
         }
+        
+        # Legal corpora repeat boilerplate (recurring notes, chapter titles),
+        # so keyword and sentence results are memoized per processor
+        self._keywords_cache = lru_cache(maxsize=4096)(self._extract_keywords)
+        self._sentences_cache = lru_cache(maxsize=4096)(self._split_sentences)
+
+    @staticmethod
+    def _compose_char_map(char_map: Dict[str, str]) -> Dict[str, str]:
+        """
+        Collapse sequential single-character replacements into one mapping
+        
+        Args:
+            char_map (Dict[str, str]): Replacements applied in insertion order
+            
+        Returns:
+            Dict[str, str]: Mapping from each source character to its final form
+        """
+        composed = {}
+        for char in char_map:
+            result = char
+            for old_char, new_char in char_map.items():
+                result = result.replace(old_char, new_char)
+            composed[char] = result
+        return composed
 
     def normalize_persian_text(self, text: str) -> str:
         """
@@ -48,8 +105,7 @@ class PersianTextProcessor:
         text = unicodedata.normalize('NFKC', text)
         
         # Character-level normalization
-        for old_char, new_char in self.char_map.items():
-            text = text.replace(old_char, new_char)
+        text = text.translate(self.char_table)
         
         return text
 
@@ -70,11 +126,11 @@ class PersianTextProcessor:
         text = self.normalize_persian_text(text)
         
         # Remove extra whitespaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Fix punctuation spacing (Persian style)
-        text = re.sub(r'\s*([،؛؟!.])\s*', r'\1 ', text)
-        text = re.sub(r'\s*([()])\s*', r' \1 ', text)
+        text = _PUNCTUATION_SPACING_RE.sub(r'\1 ', text)
+        text = _PARENTHESIS_SPACING_RE.sub(r' \1 ', text)
         
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -91,8 +147,7 @@ class PersianTextProcessor:
         Returns:
             List[str]: List of found Persian numbers
         """
-        pattern = r'[۰-۹]+(?:[./][۰-۹]+)*'
-        return re.findall(pattern, text)
+        return _PERSIAN_NUMBER_RE.findall(text)
 
     def convert_persian_to_english_digits(self, text: str) -> str:
         """
@@ -130,16 +185,8 @@ class PersianTextProcessor:
         """
         dates = []
         
-        # Persian date patterns
-        patterns = [
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', 'dd/mm/yyyy'),
-            (r'(\d{1,2})/(\d{1,2})/(\d{2})', 'dd/mm/yy'),
-            (r'([۰-۹]{1,2})/([۰-۹]{1,2})/([۰-۹]{4})', 'persian_dd/mm/yyyy'),
-            (r'([۰-۹]{1,2})/([۰-۹]{1,2})/([۰-۹]{2})', 'persian_dd/mm/yy'),
-        ]
-        
-        for pattern, date_format in patterns:
-            matches = re.findall(pattern, text)
+        for pattern, date_format in _DATE_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 date_str = '/'.join(match)
                 dates.append({'date': date_str, 'format': date_format})
@@ -161,11 +208,15 @@ class PersianTextProcessor:
         if not text:
             return []
         
+        return list(self._keywords_cache(text, min_length, max_keywords))
+
+    def _extract_keywords(self, text: str, min_length: int, max_keywords: int) -> Tuple[str, ...]:
+        """Uncached body of extract_keywords; returns a tuple so cached results stay immutable"""
         # Clean text first
         cleaned_text = self.clean_text(text)
         
         # Split into words
-        words = re.findall(r'[\u0600-\u06FF\u200C\u200D]+', cleaned_text)
+        words = _PERSIAN_WORD_RE.findall(cleaned_text)
         
         # Filter and score keywords
         keyword_scores = {}
@@ -178,7 +229,7 @@ class PersianTextProcessor:
         
         # Sort by score and return top keywords
         sorted_keywords = sorted(keyword_scores.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in sorted_keywords[:max_keywords]]
+        return tuple(word for word, _ in sorted_keywords[:max_keywords])
 
     def is_valid_persian_text(self, text: str) -> bool:
         """
@@ -194,8 +245,8 @@ class PersianTextProcessor:
             return False
         
         # Check for Persian characters
-        persian_char_count = len(re.findall(r'[\u0600-\u06FF]', text))
-        total_chars = len(re.findall(r'[\w]', text))
+        persian_char_count = len(_PERSIAN_CHAR_RE.findall(text))
+        total_chars = len(_WORD_CHAR_RE.findall(text))
         
         if total_chars == 0:
             return False
@@ -217,9 +268,11 @@ class PersianTextProcessor:
         if not text:
             return []
         
-        # Persian sentence boundary markers
-        sentence_pattern = r'[.؟!؛]\s+'
-        sentences = re.split(sentence_pattern, text.strip())
+        return list(self._sentences_cache(text))
+
+    def _split_sentences(self, text: str) -> Tuple[str, ...]:
+        """Uncached body of split_sentences"""
+        sentences = _SENTENCE_BOUNDARY_RE.split(text.strip())
         
         # Clean and filter sentences
         cleaned_sentences = []
@@ -228,7 +281,39 @@ class PersianTextProcessor:
             if sentence and len(sentence) > 10:
                 cleaned_sentences.append(sentence)
         
-        return cleaned_sentences
+        return tuple(cleaned_sentences)
+
+    def clear_caches(self) -> None:
+        """Drop memoized keyword and sentence results"""
+        self._keywords_cache.cache_clear()
+        self._sentences_cache.cache_clear()
+
+    def sentence_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Locate sentences in text without copying them
+        
+        Unlike split_sentences, every sentence is kept (including short ones)
+        and the terminal punctuation stays inside its span.
+        
+        Args:
+            text (str): Input text
+            
+        Returns:
+            List[Tuple[int, int]]: (start, end) offsets of each sentence in text
+        """
+        spans = []
+        start = len(text) - len(text.lstrip())
+        
+        for match in _SENTENCE_BOUNDARY_RE.finditer(text):
+            # Keep the punctuation mark, drop the whitespace after it
+            spans.append((start, match.start() + 1))
+            start = match.end()
+        
+        end = len(text.rstrip())
+        if end > start:
+            spans.append((start, end))
+        
+        return spans
 
     def extract_legal_references(self, text: str) -> List[Dict[str, str]]:
         """
@@ -242,17 +327,8 @@ class PersianTextProcessor:
         """
         references = []
         
-        # Patterns for legal references
-        patterns = [
-            (r'(ماده\s*[۰-۹]+)', 'article'),
-            (r'(تبصره\s*[۰-۹]*)', 'note'),
-            (r'(بند\s*[۰-۹]+)', 'subsection'),
-            (r'(فصل\s*[۰-۹]+)', 'chapter'),
-            (r'(قانون\s+[^.،؛]+)', 'law_reference'),
-        ]
-        
-        for pattern, ref_type in patterns:
-            matches = re.findall(pattern, text)
+        for pattern, ref_type in _LEGAL_REFERENCE_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 references.append({
                     'text': match,
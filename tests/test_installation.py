@@ -173,7 +173,7 @@ def test_models():
         print(f"✅ مدل LegalDocument: {document.total_articles} ماده")
         
         # Test JSON serialization
-        doc_json = document.json(ensure_ascii=False)
+        doc_json = document.model_dump_json()
         json_obj = json.loads(doc_json)
         print(f"✅ سریالایزیشن JSON: {len(doc_json)} کاراکتر")
         
@@ -288,6 +288,96 @@ def test_sample_processing():
         traceback.print_exc()
         return False
 
+def test_pipeline_parse_phase():
+    """Test pipeline phase 1.2 (structure parsing) on a sample law"""
+    print("\n🔍 تست فاز تجزیه pipeline...")
+    
+    from scripts.process_documents import DocumentProcessingPipeline
+    from src.core.models import LegalDocument
+    
+    sample_law = {
+        'id': 'law_001',
+        'title': 'قانون نمونه تست',
+        'approval_date': '01/01/1400',
+        'approval_authority': 'مجلس شورای اسلامی',
+        'raw_content': (
+            'قانون نمونه تست (مصوب ۰۱/۰۱/۱۴۰۰)\n'
+            'ماده ۱ - این متن نمونه برای تست تجزیه است.\n'
+            '۱ - بند اول ماده\n'
+            'تبصره ۱ - تبصره نمونه\n'
+            'ماده ۲ - ماده دوم قانون نمونه.'
+        ),
+        'quality_score': 0.8
+    }
+    
+    pipeline = DocumentProcessingPipeline()
+    try:
+        documents = pipeline.phase_2_parse_documents([sample_law])
+    finally:
+        pipeline.close()
+    
+    assert len(documents) == 1
+    document = documents[0]
+    assert isinstance(document, LegalDocument)
+    assert document.id == 'law_001'
+    assert document.total_articles == 2
+    assert document.raw_content == sample_law['raw_content']
+    assert pipeline.pipeline_stats['failed_documents'] == 0
+    assert pipeline.parser.parsing_stats['documents_parsed'] == 1
+    
+    print(f"✅ فاز تجزیه: {document.total_articles} ماده")
+    return True
+
+def _word_count(text):
+    """Word-count sizer for chunker tests (module-level, so it can be pickled)"""
+    return len(text.split())
+
+def test_chunker_size_fn():
+    """Test chunk budgets measured with a custom size_fn instead of characters"""
+    print("\n🔍 تست chunker با size_fn سفارشی...")
+    
+    from src.core.config import DOCUMENT_CONFIG
+    from src.core.models import LegalDocument, LegalArticle, LegalNote
+    from src.data_processing.chunker import IntelligentChunker
+    
+    config = dict(DOCUMENT_CONFIG, size_fn=_word_count,
+                  min_chunk_size=20, max_chunk_size=50, chunk_overlap=20)
+    chunker = IntelligentChunker(config)
+    
+    # 12 sentences of 9 words pack into chunks of 45, 45 and 18 words
+    sentence = 'دانشگاه موظف است مقررات این قانون را اجرا کند.'
+    content = ' '.join([sentence] * 12)
+    
+    chunks = chunker.split_long_content(content, 'article')
+    assert len(chunks) == 3
+    assert all(_word_count(chunk) <= 50 for chunk in chunks)
+    # The last chunk has room for the 20-word overlap from the one before it
+    assert chunks[2].split()[:20] == chunks[1].split()[-20:]
+    
+    article = LegalArticle(
+        number="ماده ۱",
+        content=content,
+        notes=[LegalNote(number="تبصره ۱", content="این ماده از تاریخ تصویب اجرا می‌شود.")]
+    )
+    document = LegalDocument(
+        id="test_001",
+        title="قانون نمونه",
+        approval_date="01/01/1400",
+        approval_authority="مجلس شورای اسلامی",
+        document_type="قانون",
+        standalone_articles=[article]
+    )
+    
+    document_chunks = chunker.chunk_document(document)
+    sizes = [_word_count(chunk.content) for chunk in document_chunks]
+    assert all(size <= 50 for size in sizes)
+    # Only the short note chunk is below min_chunk_size
+    assert chunker.chunking_stats['oversized_chunks'] == 0
+    assert chunker.chunking_stats['undersized_chunks'] == sum(size < 20 for size in sizes) == 1
+    
+    print(f"✅ size_fn سفارشی: {len(document_chunks)} chunk در بودجه {config['max_chunk_size']} کلمه")
+    return True
+
 def check_input_file():
     """Check if input file exists"""
     print("\n🔍 بررسی فایل ورودی...")
@@ -348,6 +438,8 @@ def generate_test_report():
         ("Data Models", test_models),
         ("File Structure", test_file_structure),
         ("Sample Processing", test_sample_processing),
+        ("Pipeline Parse Phase", test_pipeline_parse_phase),
+        ("Chunker size_fn", test_chunker_size_fn),
         ("Write Permissions", test_write_permissions),
         ("Input File", check_input_file)
     ]